@@ -3,21 +3,163 @@
 This module provides backend classes for different data sources:
 - PeeweeBackend: For Peewee ORM queries
 - IterableBackend: For Python iterable data structures
+- PandasBackend: For pandas DataFrames (requires pandas to be installed)
 
-Both backends support various lookup expressions and maintain consistent
+All backends support various lookup expressions and maintain consistent
 interfaces for filtering and ordering operations.
 """
 
+import bisect
 import logging
 import operator
-from functools import partial
+import sys
+from functools import lru_cache
 
 import peewee
 
-from lumi_filter.operator import generic_ilike_operator, generic_in_operator, generic_like_operator
+from lumi_filter.operator import (
+    generic_in_operator,
+    generic_like_operator,
+    lowered_ilike_operator,
+    operator_curry,
+    series_ilike_operator,
+    series_in_operator,
+    series_like_operator,
+)
 
 logger = logging.getLogger("lumi_filter.backend")
 
+# Priority of lookup expressions missing from LOOKUP_EXPR_PRIORITY, e.g. ones
+# added by a subclass: they are checked last.
+_UNKNOWN_LOOKUP_PRIORITY = float("inf")
+
+
+@lru_cache(maxsize=1024)
+def _split_key(key):
+    """Split a dot-notation key into its path segments.
+
+    Cached per process: filter keys come from the fixed fields of the
+    filter models, so each one is split only once instead of per request.
+    Segments are interned so lookups into items whose keys are interned
+    (e.g., dicts built from literals) match by identity.
+
+    Args:
+        key (str): The key path using dot notation (e.g., 'user.name').
+
+    Returns:
+        tuple: The path segments (e.g., ('user', 'name')).
+    """
+    return tuple(sys.intern(k) for k in key.split("."))
+
+
+@lru_cache(maxsize=1024)
+def _build_getter(key):
+    """Build a function returning the value at a dot-notation key path.
+
+    Each path segment is an `operator.itemgetter`, and a single-segment key
+    returns the itemgetter itself so lookups stay a single C-level call.
+    Getters are cached since keys come from the small set of model fields.
+
+    Args:
+        key (str): The key path using dot notation (e.g., 'user.name').
+
+    Returns:
+        callable: A function taking an item and returning the nested value.
+    """
+    getters = tuple(operator.itemgetter(k) for k in _split_key(key))
+    if len(getters) == 1:
+        return getters[0]
+
+    def getter(item):
+        for get in getters:
+            item = get(item)
+        return item
+
+    return getter
+
+
+# Operators that generated predicates inline as Python expressions; {0} is
+# the item value and {1} the prepared filter value. Others are called.
+_INLINE_OPERATOR_TEMPLATES = {
+    operator.eq: "{0} == {1}",
+    operator.ne: "{0} != {1}",
+    operator.ge: "{0} >= {1}",
+    operator.le: "{0} <= {1}",
+    operator.gt: "{0} > {1}",
+    operator.lt: "{0} < {1}",
+    generic_like_operator: "{1} in str({0})",
+    lowered_ilike_operator: "{1} in str({0}).lower()",
+}
+
+
+@lru_cache(maxsize=256)
+def _compile_predicate_factory(shape):
+    """Generate a predicate factory specialized for a shape of conditions.
+
+    For a shape like ((('price',), '{0} >= {1}'), (('user', 'name'), None))
+    this compiles::
+
+        def factory(fallback, op0, v0, op1, v1):
+            def predicate(x):
+                try:
+                    return (x['price'] >= v0) and (op1(x['user']['name'], v1))
+                except (KeyError, TypeError):
+                    return fallback(x)
+            return predicate
+
+    Only key paths (as repr'd string literals) and operator templates are
+    part of the source; filter values and operators are bound as arguments.
+    Factories are cached, so each shape is compiled once per process.
+
+    Args:
+        shape (tuple): Tuple of (key_path, template) pairs, where key_path is a
+            tuple of key segments and template is an entry of
+            `_INLINE_OPERATOR_TEMPLATES` or None to call the operator.
+
+    Returns:
+        callable: factory(fallback, op0, v0, op1, v1, ...) returning the predicate.
+    """
+    params = ["fallback"]
+    checks = []
+    for i, (keys, template) in enumerate(shape):
+        params.extend((f"op{i}", f"v{i}"))
+        accessor = "x" + "".join(f"[{k!r}]" for k in keys)
+        if template is None:
+            checks.append(f"(op{i}({accessor}, v{i}))")
+        else:
+            checks.append(f"({template.format(accessor, f'v{i}')})")
+    source = (
+        f"def factory({', '.join(params)}):\n"
+        "    def predicate(x):\n"
+        "        try:\n"
+        f"            return {' and '.join(checks) or 'True'}\n"
+        "        except (KeyError, TypeError):\n"
+        "            return fallback(x)\n"
+        "    return predicate\n"
+    )
+    namespace = {}
+    exec(compile(source, "<lumi_filter predicate>", "exec"), namespace)
+    return namespace["factory"]
+
+
+class _Reversed:
+    """Sort key wrapper that inverts the ordering of the wrapped value.
+
+    Used to sort descending fields alongside ascending ones in a single
+    composite key.
+    """
+
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
+
+    def __eq__(self, other):
+        return self.value == other.value
+
+    def __lt__(self, other):
+        return other.value < self.value
+
 
 class PeeweeBackend:
     """Backend for filtering and ordering Peewee queries.
@@ -43,9 +185,9 @@ class PeeweeBackend:
         "lte": operator.le,
         "gt": operator.gt,
         "lt": operator.lt,
-        "contains": operator.mod,
-        "icontains": operator.pow,
-        "in": operator.lshift,
+        "contains": operator_curry("like"),
+        "icontains": operator_curry("ilike"),
+        "in": operator_curry("in_"),
     }
 
     def __init__(self):
@@ -57,33 +199,46 @@ class PeeweeBackend:
         pass
 
     @classmethod
-    def filter(cls, query, peewee_field, value, lookup_expr):
-        """Apply filter to the query.
+    def _is_sqlite(cls, model):
+        """Check whether a model is bound to a SQLite database.
 
-        Applies a filter condition to the Peewee query based on the provided
-        field, value, and lookup expression. Handles special cases for text
-        search operations, adjusting the value format for different database
-        backends (SQLite uses FTS syntax with asterisks, others use SQL LIKE
-        with percent signs).
+        Not cached, since a model can be re-bound (`bind`, `bind_ctx`) and a
+        Proxy re-initialized at any time.
 
         Args:
-            query (peewee.Query): The Peewee query to filter.
+            model: The Peewee model class of the query.
+
+        Returns:
+            bool: True if the model's database is SQLite (directly or via Proxy).
+        """
+        database = model._meta.database
+        if isinstance(database, peewee.Proxy):
+            database = database.obj
+        return isinstance(database, peewee.SqliteDatabase)
+
+    @classmethod
+    def _build_expression(cls, model, peewee_field, value, lookup_expr):
+        """Build the Peewee expression for a single filter condition.
+
+        Handles special cases for text search operations, adjusting the value
+        format for different database backends (SQLite uses FTS syntax with
+        asterisks, others use SQL LIKE with percent signs).
+
+        Args:
+            model: The Peewee model class of the query.
             peewee_field (peewee.Field): The Peewee field to filter on.
             value: The value to filter by.
             lookup_expr (str): The lookup expression for filtering (e.g., '', '!',
                 'gte', 'lte', 'gt', 'lt', 'contains', 'icontains', 'in').
 
         Returns:
-            peewee.Query: Filtered query with the condition applied.
+            peewee.Expression: The condition expression.
 
         Raises:
             TypeError: If peewee_field is not a Peewee Field instance.
         """
         if lookup_expr == "contains":
-            if isinstance(query.model._meta.database, peewee.SqliteDatabase) or (
-                isinstance(query.model._meta.database, peewee.Proxy)
-                and isinstance(query.model._meta.database.obj, peewee.SqliteDatabase)
-            ):
+            if cls._is_sqlite(model):
                 value = f"*{value}*"
             else:
                 value = f"%{value}%"
@@ -94,7 +249,51 @@ class PeeweeBackend:
             raise TypeError(f"Expected peewee.Field, got {type(peewee_field)}")
 
         operator_func = cls.LOOKUP_EXPR_OPERATOR_MAP[lookup_expr]
-        return query.where(operator_func(peewee_field, value))
+        return operator_func(peewee_field, value)
+
+    @classmethod
+    def filter(cls, query, peewee_field, value, lookup_expr):
+        """Apply filter to the query.
+
+        Args:
+            query (peewee.Query): The Peewee query to filter.
+            peewee_field (peewee.Field): The Peewee field to filter on.
+            value: The value to filter by.
+            lookup_expr (str): The lookup expression for filtering (e.g., '', '!',
+                'gte', 'lte', 'gt', 'lt', 'contains', 'icontains', 'in').
+
+        Returns:
+            peewee.Query: Filtered query with the condition applied.
+
+        Raises:
+            TypeError: If peewee_field is not a Peewee Field instance.
+        """
+        return query.where(cls._build_expression(query.model, peewee_field, value, lookup_expr))
+
+    @classmethod
+    def filter_many(cls, query, conditions):
+        """Apply several filters to the query.
+
+        All expressions are passed to a single `query.where` call, which ANDs
+        them, so the query is cloned once rather than once per condition.
+
+        Args:
+            query (peewee.Query): The Peewee query to filter.
+            conditions (list): List of (peewee_field, value, lookup_expr) tuples.
+
+        Returns:
+            peewee.Query: Filtered query with all conditions applied.
+
+        Raises:
+            TypeError: If a peewee_field is not a Peewee Field instance.
+        """
+        model = query.model
+        return query.where(
+            *[
+                cls._build_expression(model, peewee_field, value, lookup_expr)
+                for peewee_field, value, lookup_expr in conditions
+            ]
+        )
 
     @classmethod
     def order(cls, query, ordering):
@@ -109,10 +308,7 @@ class PeeweeBackend:
         Returns:
             peewee.Query: Ordered query.
         """
-        order_fields = []
-        for field, is_negative in ordering:
-            order_fields.append(field.desc() if is_negative else field.asc())
-        return query.order_by(*order_fields)
+        return query.order_by(*[field.desc() if is_negative else field.asc() for field, is_negative in ordering])
 
 
 class IterableBackend:
@@ -130,6 +326,9 @@ class IterableBackend:
     Attributes:
         LOOKUP_EXPR_OPERATOR_MAP (dict): Mapping of lookup expressions
             to corresponding operator functions.
+        LOOKUP_EXPR_PRIORITY (dict): Evaluation order of lookup expressions
+            in `filter_many`; equality first, substring matches last. Lookups
+            missing from it are checked after all others.
     """
 
     LOOKUP_EXPR_OPERATOR_MAP = {
@@ -140,21 +339,34 @@ class IterableBackend:
         "gt": operator.gt,
         "lt": operator.lt,
         "contains": generic_like_operator,
-        "icontains": generic_ilike_operator,
+        "icontains": lowered_ilike_operator,
         "in": generic_in_operator,
     }
 
+    LOOKUP_EXPR_PRIORITY = {
+        "": 0,
+        "in": 0,
+        "!": 1,
+        "gte": 2,
+        "lte": 2,
+        "gt": 2,
+        "lt": 2,
+        "contains": 3,
+        "icontains": 3,
+    }
+
     @classmethod
-    def _get_nested_value(cls, item, key):
-        """Get nested value from item using dot notation.
+    def _get_nested_value(cls, item, keys):
+        """Get nested value from item by walking a pre-split key path.
 
-        Extracts a value from a nested data structure using dot notation
-        for the key path. For example, 'user.profile.name' would access
+        Extracts a value from a nested data structure following the given
+        key path. For example, ('user', 'profile', 'name') would access
         item['user']['profile']['name'].
 
         Args:
             item: The item to extract value from (dict-like object).
-            key (str): The key path using dot notation (e.g., 'user.name').
+            keys (tuple): The key path, already split on dots
+                (e.g., ('user', 'name')).
 
         Returns:
             The nested value.
@@ -162,36 +374,178 @@ class IterableBackend:
         Raises:
             KeyError: If any part of the key path doesn't exist.
         """
-        for k in key.split("."):
+        for k in keys:
             item = item[k]
         return item
 
     @classmethod
-    def _match_item(cls, item, key, value, lookup_expr):
-        """Check if item matches the filter criteria.
+    def _resolve_operator(cls, value, lookup_expr):
+        """Resolve the operator for a lookup expression and prepare its value.
+
+        Args:
+            value: The value to match against.
+            lookup_expr (str): The lookup expression for matching.
+
+        Returns:
+            tuple: (operator_func, value) ready to be applied to item values.
+        """
+        operator_func = cls.LOOKUP_EXPR_OPERATOR_MAP[lookup_expr]
+        if lookup_expr in ("contains", "icontains"):
+            # Stringify (and lower-case) the needle once instead of per item.
+            value = str(value).lower() if lookup_expr == "icontains" else str(value)
+        elif lookup_expr == "in" and isinstance(value, (list, tuple, set)):
+            # Hash-based membership per item; keep the original for unhashable values.
+            try:
+                value = frozenset(value)
+            except TypeError:
+                pass
+        return operator_func, value
+
+    @classmethod
+    def _build_predicate(cls, key, value, lookup_expr):
+        """Build a predicate checking whether an item matches the filter criteria.
 
-        Evaluates whether an item satisfies the specified filter condition.
-        Uses the appropriate operator based on the lookup expression and
-        handles nested field access. Returns True on errors (KeyError, TypeError)
-        to maintain a permissive filtering approach.
+        The key path is split and the operator is resolved once here, so the
+        returned closure only walks the path and compares for each item.
+        The predicate returns True on errors (KeyError, TypeError) to
+        maintain a permissive filtering approach.
 
         Args:
-            item: The item to check (dict-like object).
             key (str): The key to filter on (supports dot notation).
             value: The value to match against.
             lookup_expr (str): The lookup expression for matching (e.g., '', '!',
                 'gte', 'lte', 'gt', 'lt', 'contains', 'icontains', 'in').
 
         Returns:
-            bool: True if item matches the criteria, True on error (permissive).
+            callable: A function taking an item and returning a bool.
         """
-        try:
-            item_value = cls._get_nested_value(item, key)
-            operator_func = cls.LOOKUP_EXPR_OPERATOR_MAP[lookup_expr]
-            return operator_func(item_value, value)
-        except (KeyError, TypeError):
+        keys = _split_key(key)
+        operator_func, value = cls._resolve_operator(value, lookup_expr)
+
+        # The shape of the path is decided once so flat keys skip the walk
+        # loop. The try blocks cost nothing unless an exception is raised.
+        if len(keys) == 1:
+            (key,) = keys
+
+            def predicate(item):
+                try:
+                    return operator_func(item[key], value)
+                except (KeyError, TypeError):
+                    return True
+
+        else:
+
+            def predicate(item):
+                try:
+                    for k in keys:
+                        item = item[k]
+                    return operator_func(item, value)
+                except (KeyError, TypeError):
+                    return True
+
+        return predicate
+
+    @classmethod
+    def _build_group_predicate(cls, key, criteria):
+        """Build a predicate checking several criteria on the same key.
+
+        The key path is walked once per item and the value is reused for
+        every criterion, e.g. both bounds of a `price__gte`/`price__lte` range.
+        Errors are permissive per criterion, as in `_build_predicate`.
+
+        Args:
+            key (str): The key to filter on (supports dot notation).
+            criteria (list): List of (value, lookup_expr) tuples.
+
+        Returns:
+            callable: A function taking an item and returning a bool.
+        """
+        if len(criteria) == 1:
+            ((value, lookup_expr),) = criteria
+            return cls._build_predicate(key, value, lookup_expr)
+
+        keys = _split_key(key)
+        checks = [cls._resolve_operator(value, lookup_expr) for value, lookup_expr in criteria]
+
+        def predicate(item):
+            try:
+                for k in keys:
+                    item = item[k]
+            except (KeyError, TypeError):
+                return True
+            for operator_func, value in checks:
+                try:
+                    if not operator_func(item, value):
+                        return False
+                except (KeyError, TypeError):
+                    pass
             return True
 
+        return predicate
+
+    @classmethod
+    def _build_conditions_predicate(cls, conditions):
+        """Build one predicate checking all conditions with short-circuit AND.
+
+        Conditions are checked in `LOOKUP_EXPR_PRIORITY` order by a function
+        generated for the shape of the conditions (see
+        `_compile_predicate_factory`), with comparisons inlined. Items whose
+        check raises are re-checked by `_build_permissive_predicate`, which
+        keeps the permissive error semantics per condition.
+
+        Args:
+            conditions (list): List of (key, value, lookup_expr) tuples.
+
+        Returns:
+            callable: A function taking an item and returning a bool.
+        """
+        conditions = sorted(
+            conditions, key=lambda condition: cls.LOOKUP_EXPR_PRIORITY.get(condition[2], _UNKNOWN_LOOKUP_PRIORITY)
+        )
+        shape = []
+        args = []
+        for key, value, lookup_expr in conditions:
+            operator_func, value = cls._resolve_operator(value, lookup_expr)
+            shape.append((_split_key(key), _INLINE_OPERATOR_TEMPLATES.get(operator_func)))
+            args.extend((operator_func, value))
+        return _compile_predicate_factory(tuple(shape))(cls._build_permissive_predicate(conditions), *args)
+
+    @classmethod
+    def _build_permissive_predicate(cls, conditions):
+        """Build a predicate checking all conditions with permissive errors.
+
+        Conditions on the same key share one lookup of the item value, and keys
+        are checked in `LOOKUP_EXPR_PRIORITY` order.
+
+        Args:
+            conditions (list): List of (key, value, lookup_expr) tuples.
+
+        Returns:
+            callable: A function taking an item and returning a bool.
+        """
+        criteria_by_key = {}
+        for key, value, lookup_expr in conditions:
+            criteria_by_key.setdefault(key, []).append((value, lookup_expr))
+        # Check the cheapest and most selective keys first so most items are
+        # rejected before the substring checks run.
+        grouped = sorted(
+            criteria_by_key.items(),
+            key=lambda entry: min(
+                cls.LOOKUP_EXPR_PRIORITY.get(lookup_expr, _UNKNOWN_LOOKUP_PRIORITY) for _, lookup_expr in entry[1]
+            ),
+        )
+        predicates = [cls._build_group_predicate(key, criteria) for key, criteria in grouped]
+        if len(predicates) == 1:
+            return predicates[0]
+
+        def predicate(item):
+            for pred in predicates:
+                if not pred(item):
+                    return False
+            return True
+
+        return predicate
+
     @classmethod
     def filter(cls, data, key, value, lookup_expr):
         """Filter the data based on criteria.
@@ -211,17 +565,122 @@ class IterableBackend:
             The filtered iterable of the same type as input (or a filter object).
         """
 
-        ret = filter(
-            partial(cls._match_item, key=key, value=value, lookup_expr=lookup_expr),
-            data,
-        )
+        return cls.filter_many(data, [(key, value, lookup_expr)])
+
+    @classmethod
+    def filter_many(cls, data, conditions):
+        """Filter the data based on several criteria in a single pass.
+
+        Every item is checked against all conditions at once, short-circuiting
+        on the first one it fails, instead of scanning the data once per
+        condition. Preserves the original data type of the input like `filter`.
+
+        Args:
+            data (iterable): The iterable data to filter.
+            conditions (list): List of (key, value, lookup_expr) tuples. An item
+                is kept only if it matches all of them.
+
+        Returns:
+            The filtered iterable of the same type as input (or a filter object).
+        """
+        predicate = cls._build_conditions_predicate(conditions)
         if isinstance(data, list):
-            return list(ret)
-        if isinstance(data, tuple):
+            return [item for item in data if predicate(item)]
+        for container_type in (tuple, set):
+            if isinstance(data, container_type):
+                return container_type(item for item in data if predicate(item))
+        return filter(predicate, data)
+
+    @classmethod
+    def filter_iter(cls, data, conditions):
+        """Lazily filter the data based on several criteria.
+
+        Unlike `filter_many`, nothing is materialized: items are checked only
+        as the result is consumed, so a caller paginating with
+        `itertools.islice` stops scanning once the page is full.
+
+        Args:
+            data (iterable): The iterable data to filter.
+            conditions (list): List of (key, value, lookup_expr) tuples. An item
+                is kept only if it matches all of them.
+
+        Returns:
+            iterator: An iterator over the matching items.
+        """
+        return filter(cls._build_conditions_predicate(conditions), data)
+
+    @classmethod
+    def filter_sorted(cls, data, key, value, lookup_expr):
+        """Filter a sequence that is already sorted ascending by key.
+
+        An opt-in helper for callers that keep their data sorted; `Model` does
+        not use it. Equality and range lookups ('', 'gt', 'gte', 'lt', 'lte')
+        locate the matching slice by binary search, so only O(log n) items are
+        read instead of all of them. Other lookups use `filter_many`. If a
+        probed item lacks the key or its value does not compare with value, the
+        permissive linear `filter_many` is used instead.
+
+        Precondition: every item has the key. Only the probed items are
+        checked, so other items lacking the key are not detected. Unlike
+        `filter_many`, which keeps items it cannot compare, such items outside
+        the bisected slice are dropped from the result.
+
+        Args:
+            data (sequence): A list or tuple sorted ascending by key, in which
+                every item has the key.
+            key (str): The key to filter on (supports dot notation).
+            value: The value to filter by.
+            lookup_expr (str): The lookup expression for filtering.
+
+        Returns:
+            A slice of data (same sequence type) with the matching items.
+        """
+        if lookup_expr not in ("", "gt", "gte", "lt", "lte"):
+            return cls.filter_many(data, [(key, value, lookup_expr)])
+
+        getter = _build_getter(key)
+        try:
+            if lookup_expr in ("lt", "lte"):
+                lo = 0
+            else:
+                lo = (bisect.bisect_right if lookup_expr == "gt" else bisect.bisect_left)(data, value, key=getter)
+            if lookup_expr in ("gt", "gte"):
+                hi = len(data)
+            else:
+                hi = (bisect.bisect_left if lookup_expr == "lt" else bisect.bisect_right)(data, value, lo, key=getter)
+        except (KeyError, TypeError):
+            return cls.filter_many(data, [(key, value, lookup_expr)])
+        return data[lo:hi]
+
+    @classmethod
+    def _build_sort_key(cls, ordering):
+        """Build the key function and direction for sorting by ordering.
+
+        Args:
+            ordering (list): Non-empty list of (key, is_reverse) tuples.
+
+        Returns:
+            tuple: (sort_key, reverse) to pass to sorted() or list.sort().
+        """
+        # A uniform direction can use sorted()'s own reverse flag; only mixed
+        # directions need the descending components wrapped.
+        reverse = all(is_reverse for _, is_reverse in ordering)
+        mixed = any(is_reverse != reverse for _, is_reverse in ordering)
+
+        if not mixed and all("." not in key for key, _ in ordering):
+            # Flat keys: itemgetter builds the (composite) key in C.
+            return operator.itemgetter(*(key for key, _ in ordering)), reverse
+
+        getters = [(_build_getter(key), mixed and is_reverse) for key, is_reverse in ordering]
+
+        def sort_key(item):
+            ret = []
+            for getter, wrap in getters:
+                value = getter(item)
+                ret.append(_Reversed(value) if wrap else value)
             return tuple(ret)
-        if isinstance(data, set):
-            return set(ret)
-        return ret
+
+        return sort_key, reverse
 
     @classmethod
     def order(cls, data, ordering):
@@ -236,10 +695,160 @@ class IterableBackend:
         Returns:
             The sorted data of the same type as input.
         """
+        if not ordering:
+            return data
+
+        sort_key, reverse = cls._build_sort_key(ordering)
         try:
-            for key, is_reverse in ordering[::-1]:
-                data = sorted(data, key=lambda x: cls._get_nested_value(x, key), reverse=is_reverse)
+            data = sorted(data, key=sort_key, reverse=reverse)
         except (KeyError, TypeError):
             logger.warning("Failed to sort by ordering: %s", ordering)
         finally:
             return data
+
+    @classmethod
+    def filter_and_order(cls, data, conditions, ordering):
+        """Filter and sort the data, building a single result list.
+
+        Equivalent to `order(filter_many(data, conditions), ordering)`, but the
+        matching items are collected into one list that is sorted in place,
+        rather than building a filtered list and then a sorted copy of it.
+
+        Args:
+            data (iterable): The iterable data to filter and sort.
+            conditions (list): List of (key, value, lookup_expr) tuples.
+            ordering (list): List of (key, is_reverse) tuples.
+
+        Returns:
+            list: The matching items, sorted. If there is no ordering or
+            sorting fails (a warning is logged), the items are returned in
+            the container type `filter_many` would use: a tuple or set for
+            tuple or set input, otherwise a list.
+        """
+        items = list(cls.filter_iter(data, conditions)) if conditions else list(data)
+        if ordering:
+            sort_key, reverse = cls._build_sort_key(ordering)
+            try:
+                items.sort(key=sort_key, reverse=reverse)
+                return items
+            except (KeyError, TypeError):
+                logger.warning("Failed to sort by ordering: %s", ordering)
+        for container_type in (tuple, set):
+            if isinstance(data, container_type):
+                return container_type(items)
+        return items
+
+
+class PandasBackend:
+    """Backend for filtering and ordering pandas DataFrames.
+
+    Conditions are evaluated as vectorized boolean masks over whole columns
+    and combined with `&`, so filtering runs in pandas' C loops instead of
+    calling a Python predicate per row. pandas is an optional dependency;
+    this backend is only selected for data that already is a DataFrame.
+
+    Keys in dot notation address columns named with dots, as produced by
+    `pandas.json_normalize`. Like IterableBackend, the backend is permissive:
+    a condition on a missing column or with incomparable types is skipped.
+
+    Attributes:
+        LOOKUP_EXPR_OPERATOR_MAP (dict): Mapping of lookup expressions
+            to corresponding Series operator functions.
+    """
+
+    LOOKUP_EXPR_OPERATOR_MAP = {
+        "": operator.eq,
+        "!": operator.ne,
+        "gte": operator.ge,
+        "lte": operator.le,
+        "gt": operator.gt,
+        "lt": operator.lt,
+        "contains": series_like_operator,
+        "icontains": series_ilike_operator,
+        "in": series_in_operator,
+    }
+
+    @classmethod
+    def from_records(cls, records):
+        """Build a DataFrame from dict records for repeated vectorized filtering.
+
+        Nested dicts are flattened into dot-named columns, so the same dotted
+        keys work here as with IterableBackend. Converting costs a pass over
+        the records; it pays off when the same records are filtered or
+        ordered many times. Unlike IterableBackend, a key missing from some
+        records becomes a NaN value, which matches no comparison.
+
+        Args:
+            records (iterable): Iterable of (possibly nested) dicts.
+
+        Returns:
+            pandas.DataFrame: One row per record.
+        """
+        import pandas
+
+        return pandas.json_normalize(list(records))
+
+    @classmethod
+    def filter(cls, data, key, value, lookup_expr):
+        """Filter the DataFrame based on criteria.
+
+        Args:
+            data (pandas.DataFrame): The DataFrame to filter.
+            key (str): The column to filter on.
+            value: The value to filter by.
+            lookup_expr (str): The lookup expression for filtering (e.g., '', '!',
+                'gte', 'lte', 'gt', 'lt', 'contains', 'icontains', 'in').
+
+        Returns:
+            pandas.DataFrame: The filtered DataFrame.
+        """
+        return cls.filter_many(data, [(key, value, lookup_expr)])
+
+    @classmethod
+    def filter_many(cls, data, conditions):
+        """Filter the DataFrame based on several criteria.
+
+        Args:
+            data (pandas.DataFrame): The DataFrame to filter.
+            conditions (list): List of (key, value, lookup_expr) tuples. A row
+                is kept only if it matches all of them.
+
+        Returns:
+            pandas.DataFrame: The filtered DataFrame.
+        """
+        mask = None
+        for key, value, lookup_expr in conditions:
+            operator_func = cls.LOOKUP_EXPR_OPERATOR_MAP[lookup_expr]
+            try:
+                condition = operator_func(data[key], value)
+            except (KeyError, TypeError):
+                continue
+            mask = condition if mask is None else mask & condition
+        if mask is None:
+            return data
+        return data[mask]
+
+    @classmethod
+    def order(cls, data, ordering):
+        """Sort the DataFrame by multiple columns.
+
+        Args:
+            data (pandas.DataFrame): The DataFrame to sort.
+            ordering (list): List of tuples containing (key, is_reverse) pairs
+                where key is the column to sort by and is_reverse is a boolean
+                indicating reverse order.
+
+        Returns:
+            pandas.DataFrame: The sorted DataFrame.
+        """
+        if not ordering:
+            return data
+        try:
+            return data.sort_values(
+                by=[key for key, _ in ordering],
+                ascending=[not is_reverse for _, is_reverse in ordering],
+                kind="stable",
+            )
+        except (KeyError, TypeError):
+            logger.warning("Failed to sort by ordering: %s", ordering)
+            return data
@@ -1,5 +1,38 @@
 import datetime
 import decimal
+from functools import lru_cache
+
+# Lookup expression sets shared by the field classes below.
+_COMPARISON_LOOKUP_EXPR = frozenset({"", "!", "gt", "lt", "gte", "lte", "in"})
+_TEXT_LOOKUP_EXPR = _COMPARISON_LOOKUP_EXPR | {"contains", "icontains"}
+
+
+# Parsed request strings are cached, since the same query values tend to
+# be sent over and over. Only str inputs are passed in (and the caches are
+# typed), so no two distinct inputs share an entry; the results are
+# immutable. Failed parses raise and are not cached.
+@lru_cache(maxsize=4096, typed=True)
+def _parse_decimal(value):
+    return decimal.Decimal(value)
+
+
+@lru_cache(maxsize=4096, typed=True)
+def _parse_date(value):
+    # fromisoformat is implemented in C. It is only used for the exact
+    # YYYY-MM-DD shape, as it also accepts forms strptime rejects
+    # (e.g. week dates), while strptime accepts non-padded dates.
+    if len(value) == 10 and value[4] == value[7] == "-":
+        return datetime.date.fromisoformat(value)
+    return datetime.datetime.strptime(value, "%Y-%m-%d").date()
+
+
+@lru_cache(maxsize=4096, typed=True)
+def _parse_datetime(value):
+    # Same fast path as _parse_date, for the exact YYYY-MM-DDTHH:MM:SS shape
+    # only, so date-only strings and UTC offsets stay invalid.
+    if len(value) == 19 and value[4] == value[7] == "-" and value[10] == "T" and value[13] == value[16] == ":":
+        return datetime.datetime.fromisoformat(value)
+    return datetime.datetime.strptime(value, "%Y-%m-%dT%H:%M:%S")
 
 
 class FilterField:
@@ -25,7 +58,9 @@ class FilterField:
             Defaults to None.
     """
 
-    SUPPORTED_LOOKUP_EXPR = frozenset({"", "!", "gt", "lt", "gte", "lte", "in", "contains", "icontains"})
+    __slots__ = ("request_arg_name", "source")
+
+    SUPPORTED_LOOKUP_EXPR = _TEXT_LOOKUP_EXPR
 
     def __init__(self, request_arg_name=None, source=None):
         self.request_arg_name = request_arg_name
@@ -68,7 +103,9 @@ class IntField(FilterField):
             - "in": List membership
     """
 
-    SUPPORTED_LOOKUP_EXPR = frozenset({"", "!", "gt", "lt", "gte", "lte", "in"})
+    __slots__ = ()
+
+    SUPPORTED_LOOKUP_EXPR = _COMPARISON_LOOKUP_EXPR
 
     def parse_value(self, value):
         """Parse string or numeric input to integer.
@@ -92,6 +129,9 @@ class IntField(FilterField):
             >>> field.parse_value("invalid")
             (None, False)
         """
+        # Exact type check: bool is an int subclass and is still converted.
+        if type(value) is int:
+            return value, True
         try:
             return int(value), True
         except (ValueError, TypeError):
@@ -119,7 +159,9 @@ class StrField(FilterField):
             - "icontains": Case-insensitive substring match
     """
 
-    SUPPORTED_LOOKUP_EXPR = frozenset({"", "!", "gt", "lt", "gte", "lte", "in", "contains", "icontains"})
+    __slots__ = ()
+
+    SUPPORTED_LOOKUP_EXPR = _TEXT_LOOKUP_EXPR
 
 
 class DecimalField(FilterField):
@@ -141,7 +183,9 @@ class DecimalField(FilterField):
             - "in": List membership
     """
 
-    SUPPORTED_LOOKUP_EXPR = frozenset({"", "!", "gt", "lt", "gte", "lte", "in"})
+    __slots__ = ()
+
+    SUPPORTED_LOOKUP_EXPR = _COMPARISON_LOOKUP_EXPR
 
     def parse_value(self, value):
         """Parse string or numeric input to Decimal.
@@ -166,7 +210,11 @@ class DecimalField(FilterField):
             >>> field.parse_value("invalid")
             (None, False)
         """
+        if type(value) is decimal.Decimal:
+            return value, True
         try:
+            if type(value) is str:
+                return _parse_decimal(value), True
             return decimal.Decimal(value), True
         except (ValueError, TypeError, decimal.InvalidOperation):
             return None, False
@@ -185,8 +233,21 @@ class BooleanField(FilterField):
             - "" (empty): Exact equality (only supports exact boolean matching)
     """
 
+    __slots__ = ()
+
     SUPPORTED_LOOKUP_EXPR = frozenset({""})
 
+    _BOOL_MAP = {
+        "true": True,
+        "1": True,
+        "yes": True,
+        "on": True,
+        "false": False,
+        "0": False,
+        "no": False,
+        "off": False,
+    }
+
     def parse_value(self, value):
         """Parse various representations to boolean.
 
@@ -219,11 +280,9 @@ class BooleanField(FilterField):
         if isinstance(value, bool):
             return value, True
         if isinstance(value, str):
-            lower_value = value.lower()
-            if lower_value in ("true", "1", "yes", "on"):
-                return True, True
-            elif lower_value in ("false", "0", "no", "off"):
-                return False, True
+            parsed_value = self._BOOL_MAP.get(value.lower())
+            if parsed_value is not None:
+                return parsed_value, True
         return None, False
 
 
@@ -245,7 +304,9 @@ class DateField(FilterField):
             - "in": Date list membership
     """
 
-    SUPPORTED_LOOKUP_EXPR = frozenset({"", "!", "gt", "lt", "gte", "lte", "in"})
+    __slots__ = ()
+
+    SUPPORTED_LOOKUP_EXPR = _COMPARISON_LOOKUP_EXPR
 
     def parse_value(self, value):
         """Parse datetime.date objects or ISO date strings.
@@ -272,9 +333,11 @@ class DateField(FilterField):
         """
         if isinstance(value, datetime.date):
             return value, True
+        if not isinstance(value, str):
+            return None, False
         try:
-            return datetime.datetime.strptime(value, "%Y-%m-%d").date(), True
-        except (ValueError, TypeError):
+            return _parse_date(value), True
+        except ValueError:
             return None, False
 
 
@@ -296,7 +359,9 @@ class DateTimeField(FilterField):
             - "in": DateTime list membership
     """
 
-    SUPPORTED_LOOKUP_EXPR = frozenset({"", "!", "gt", "lt", "gte", "lte", "in"})
+    __slots__ = ()
+
+    SUPPORTED_LOOKUP_EXPR = _COMPARISON_LOOKUP_EXPR
 
     def parse_value(self, value):
         """Parse datetime.datetime objects or ISO datetime strings.
@@ -323,7 +388,9 @@ class DateTimeField(FilterField):
         """
         if isinstance(value, datetime.datetime):
             return value, True
+        if not isinstance(value, str):
+            return None, False
         try:
-            return datetime.datetime.strptime(value, "%Y-%m-%dT%H:%M:%S"), True
-        except (ValueError, TypeError):
+            return _parse_datetime(value), True
+        except ValueError:
             return None, False
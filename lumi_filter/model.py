@@ -5,15 +5,28 @@ for filtering and ordering different types of data sources including
 Peewee ORM queries, Pydantic models, and iterable data structures.
 """
 
+import sys
+from collections import namedtuple
+from functools import lru_cache
 from typing import Iterable
+from weakref import WeakKeyDictionary
 
 import peewee
 import pydantic
 
-from lumi_filter.backend import IterableBackend, PeeweeBackend
+from lumi_filter.backend import IterableBackend, PandasBackend, PeeweeBackend
 from lumi_filter.field import FilterField
 from lumi_filter.map import pd_filter_mapping, pw_filter_mapping
 
+# Value type of __supported_query_key_field_dict__.
+FieldInfo = namedtuple("FieldInfo", ["field", "lookup_expr"])
+
+# Backend class per model class and data type, so the isinstance checks
+# (including the ABC Iterable check) run once per type rather than once per
+# call. Keyed by model class first, as subclasses may override
+# _resolve_backend.
+_backend_cache = WeakKeyDictionary()
+
 
 class MetaModel:
     """Configuration class for model metadata.
@@ -93,10 +106,26 @@ class MetaModel:
     def _process_pydantic_fields(self):
         """Process Pydantic model fields into filter fields with nested support.
 
+        The nested schema walk is cached per (MetaModel class, schema, fields);
+        the field class is looked up in pd_filter_mapping on every call, so
+        later changes to the mapping are honoured.
+
         Returns:
             dict: Dictionary mapping field names to filter field instances
         """
         ret = {}
+        for new_key, annotation in _walk_pydantic_schema(type(self), self.schema, tuple(self.fields)):
+            filter_field_class = pd_filter_mapping.get(annotation, FilterField)
+            field_name = new_key.replace(".", "_")
+            ret[field_name] = filter_field_class(request_arg_name=new_key, source=new_key)
+        return ret
+
+    def _iter_pydantic_fields(self):
+        """Walk the Pydantic schema, descending into nested models.
+
+        Yields:
+            tuple: (dotted_key, annotation) for each selected leaf field
+        """
         stack = [(self.schema.model_fields, "")]
 
         while stack:
@@ -115,10 +144,7 @@ class MetaModel:
                     if self.fields and new_key not in self.fields:
                         continue
 
-                    filter_field_class = pd_filter_mapping.get(pydantic_field.annotation, FilterField)
-                    field_name = new_key.replace(".", "_")
-                    ret[field_name] = filter_field_class(request_arg_name=new_key, source=new_key)
-        return ret
+                    yield new_key, pydantic_field.annotation
 
     def _is_nested_pydantic_model(self, pydantic_field):
         """Check if a Pydantic field is a nested model.
@@ -132,6 +158,36 @@ class MetaModel:
         return isinstance(pydantic_field.annotation, type) and issubclass(pydantic_field.annotation, pydantic.BaseModel)
 
 
+@lru_cache(maxsize=256)
+def _walk_pydantic_schema(meta_model_class, schema, fields):
+    """Walk a Pydantic schema once per MetaModel class, schema and field list.
+
+    Args:
+        meta_model_class (type): MetaModel (sub)class performing the walk
+        schema: The Pydantic model class
+        fields (tuple): Specific fields to include, or empty for all
+
+    Returns:
+        tuple: (dotted_key, annotation) tuples
+    """
+    return tuple(meta_model_class(schema, list(fields))._iter_pydantic_fields())
+
+
+@lru_cache(maxsize=64)
+def _get_lookup_suffixes(lookup_exprs):
+    """Map each lookup expression to the query key suffix it is requested by.
+
+    Args:
+        lookup_exprs (frozenset): Lookup expressions supported by a field
+
+    Returns:
+        tuple: (lookup_expr, suffix) tuples, e.g. ("gte", "__gte")
+    """
+    return tuple(
+        (lookup_expr, lookup_expr if lookup_expr in ("", "!") else f"__{lookup_expr}") for lookup_expr in lookup_exprs
+    )
+
+
 class ModelMeta(type):
     """Metaclass for creating filter models with field validation.
 
@@ -145,8 +201,11 @@ class ModelMeta(type):
         meta_options = cls._extract_meta_options(attrs)
         meta_model = MetaModel(**meta_options)
 
-        # Merge schema fields with explicit attrs (attrs have priority)
-        attrs = meta_model.get_filter_fields() | attrs
+        # Merge schema fields with explicit attrs (attrs have priority). The
+        # fields dict is freshly built, so it is updated in place.
+        merged_attrs = meta_model.get_filter_fields()
+        merged_attrs.update(attrs)
+        attrs = merged_attrs
 
         filter_fields = []
         filter_field_map = {}
@@ -165,6 +224,12 @@ class ModelMeta(type):
         cls._validate_source_type_consistency(source_types, name)
 
         attrs["__supported_query_key_field_dict__"] = supported_query_key_field_dict
+        # Flattened view used by cls_filter, so a request key resolves to its
+        # source, parser and lookup with a single dict hit.
+        attrs["__filter_dispatch__"] = {
+            key: (field.source, field.parse_value, lookup_expr)
+            for key, (field, lookup_expr) in supported_query_key_field_dict.items()
+        }
         attrs["__ordering_field_map__"] = filter_field_map
 
         return super().__new__(cls, name, bases, attrs)
@@ -174,31 +239,22 @@ class ModelMeta(type):
         """Generate lookup expressions mapping for a field."""
         lookup_mappings = {}
 
-        for lookup_expr in field.SUPPORTED_LOOKUP_EXPR:
-            if lookup_expr == "":
-                supported_query_key = field.request_arg_name
-            elif lookup_expr == "!":
-                supported_query_key = f"{field.request_arg_name}{lookup_expr}"
-            else:
-                supported_query_key = f"{field.request_arg_name}__{lookup_expr}"
-
-            lookup_mappings[supported_query_key] = {
-                "field": field,
-                "lookup_expr": lookup_expr,
-            }
+        request_arg_name = field.request_arg_name
+        for lookup_expr, suffix in _get_lookup_suffixes(frozenset(field.SUPPORTED_LOOKUP_EXPR)):
+            supported_query_key = request_arg_name + suffix
+            # Interned so that callers passing the same interned key (e.g. a
+            # literal) get an identity match in the dispatch dicts.
+            lookup_mappings[sys.intern(supported_query_key)] = FieldInfo(field, lookup_expr)
 
         return lookup_mappings
 
     @staticmethod
     def _extract_meta_options(attrs):
         """Extract Meta class options."""
-        meta_options = {}
         meta = attrs.pop("Meta", None)
-        if meta:
-            for k, v in meta.__dict__.items():
-                if not k.startswith("_"):
-                    meta_options[k] = v
-        return meta_options
+        if not meta:
+            return {}
+        return {k: v for k, v in vars(meta).items() if not k.startswith("_")}
 
     @staticmethod
     def _configure_field(field, field_name):
@@ -265,57 +321,142 @@ class Model(metaclass=ModelMeta):
             Filtered data
         """
         backend = cls._get_backend(data)
+        conditions = cls._get_conditions(request_args)
+        if not conditions:
+            return data
+        return backend.filter_many(data, conditions)
 
-        for req_field_name, req_value in request_args.items():
-            field_info = cls.__supported_query_key_field_dict__.get(req_field_name)
-            if not field_info:
-                continue
+    @classmethod
+    def cls_order(cls, data, request_args):
+        """Apply ordering to data based on request arguments.
 
-            field = field_info["field"]
-            lookup_expr = field_info["lookup_expr"]
+        Args:
+            data: The data to order
+            request_args (dict): Dictionary containing ordering parameters
+
+        Returns:
+            Ordered data
+        """
+        ordering = cls._get_ordering(request_args)
+        if ordering is None:
+            return data
+        backend = cls._get_backend(data)
+        return backend.order(data, ordering)
 
-            parsed_value, is_valid = field.parse_value(req_value)
+    @classmethod
+    def cls_filter_and_order(cls, data, request_args):
+        """Apply filters and ordering to data based on request arguments.
+
+        Equivalent to `cls_order(cls_filter(data, request_args), request_args)`.
+        For iterable data both steps share a single result list. If sorting
+        fails, list, tuple and set input keep their container type as in the
+        chained calls, while other iterables are returned as a list.
+
+        Args:
+            data: The data to filter and order
+            request_args (dict): Dictionary of filter and ordering parameters
+
+        Returns:
+            Filtered and ordered data
+        """
+        backend = cls._get_backend(data)
+        conditions = cls._get_conditions(request_args)
+        ordering = cls._get_ordering(request_args)
+        if issubclass(backend, IterableBackend) and conditions and ordering:
+            return backend.filter_and_order(data, conditions, ordering)
+        if conditions:
+            data = backend.filter_many(data, conditions)
+        if ordering is not None:
+            data = backend.order(data, ordering)
+        return data
+
+    @classmethod
+    def _get_conditions(cls, request_args):
+        """Parse request arguments into backend filter conditions.
+
+        Args:
+            request_args (dict): Dictionary of filter parameters
+
+        Returns:
+            list: List of (source, parsed_value, lookup_expr) tuples
+        """
+        dispatch = cls.__filter_dispatch__
+        conditions = []
+
+        items = request_args.items()
+        if len(request_args) > len(dispatch):
+            # Mostly unrelated parameters: probe the request for each
+            # supported key rather than the other way round.
+            items = [(key, request_args[key]) for key in dispatch if key in request_args]
+
+        for req_field_name, req_value in items:
+            entry = dispatch.get(req_field_name)
+            if entry is None:
+                continue
+
+            source, parse_value, lookup_expr = entry
+            parsed_value, is_valid = parse_value(req_value)
             if not is_valid:
                 continue
 
-            if lookup_expr in ["in", "iin"]:
+            if lookup_expr in ("in", "iin"):
                 parsed_value = parsed_value.split(",")
 
-            data = backend.filter(data, field.source, parsed_value, lookup_expr)
+            conditions.append((source, parsed_value, lookup_expr))
 
-        return data
+        return conditions
 
     @classmethod
-    def cls_order(cls, data, request_args):
-        """Apply ordering to data based on request arguments.
+    def _get_ordering(cls, request_args):
+        """Parse the ordering request argument into backend ordering.
 
         Args:
-            data: The data to order
             request_args (dict): Dictionary containing ordering parameters
 
         Returns:
-            Ordered data
+            list or None: List of (source, is_negative) tuples, or None if no
+            ordering was requested
         """
         ordering = request_args.get("ordering", "")
         if not ordering:
-            return data
-        backend = cls._get_backend(data)
+            return None
+        get_field = cls.__ordering_field_map__.get
+        if "," not in ordering:
+            # Single-field ordering, the common case, skips the split.
+            is_negative = ordering[:1] == "-"
+            field = get_field(ordering[1:] if is_negative else ordering)
+            return [(field.source, is_negative)] if field else []
         available_ordering = []
         for field_name in ordering.split(","):
-            is_negative = field_name.startswith("-")
-            if is_negative:
-                field_name = field_name[1:]
-            field = cls.__ordering_field_map__.get(field_name)
+            is_negative = field_name[:1] == "-"
+            field = get_field(field_name[1:] if is_negative else field_name)
             if not field:
                 continue
             available_ordering.append((field.source, is_negative))
-        return backend.order(data, available_ordering)
+        return available_ordering
 
     @classmethod
     def _get_backend(cls, data):
         """Get appropriate backend class for data type."""
+        type_cache = _backend_cache.get(cls)
+        if type_cache is None:
+            type_cache = _backend_cache[cls] = WeakKeyDictionary()
+        data_type = type(data)
+        backend = type_cache.get(data_type)
+        if backend is None:
+            backend = type_cache[data_type] = cls._resolve_backend(data)
+        return backend
+
+    @classmethod
+    def _resolve_backend(cls, data):
+        """Resolve the backend class for data by its type hierarchy."""
+        # A DataFrame can only exist once pandas has been imported, so there is
+        # no need to import the optional dependency here.
+        pandas = sys.modules.get("pandas")
         if isinstance(data, peewee.ModelSelect):
             return PeeweeBackend
+        elif pandas is not None and isinstance(data, pandas.DataFrame):
+            return PandasBackend
         elif isinstance(data, Iterable):
             return IterableBackend
         else:
@@ -339,6 +480,15 @@ class Model(metaclass=ModelMeta):
         self.data = self.__class__.cls_order(self.data, self.request_args)
         return self
 
+    def filter_and_order(self):
+        """Apply filters and ordering in one step and return self for chaining.
+
+        Returns:
+            Model: Self for method chaining
+        """
+        self.data = self.__class__.cls_filter_and_order(self.data, self.request_args)
+        return self
+
     def result(self):
         """Get the final filtered and ordered data.
 
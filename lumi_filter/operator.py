@@ -31,6 +31,22 @@ def generic_ilike_operator(left, right):
     return str(right).lower() in str(left).lower()
 
 
+def lowered_ilike_operator(left, right):
+    """Case-insensitive contains operator with a pre-lowered needle.
+
+    Unlike generic_ilike_operator, right must already be a lower-cased
+    string, so filtering many values lowers the needle only once.
+
+    Args:
+        left: The value to search in
+        right (str): The lower-cased string to search for
+
+    Returns:
+        bool: True if right is contained in left (case-insensitive)
+    """
+    return right in str(left).lower()
+
+
 def generic_in_operator(left, right):
     """Generic membership operator.
 
@@ -92,3 +108,46 @@ def generic_is_null_operator(left, right):
     """
     is_null_check = right == "true"
     return (left is None) if is_null_check else (left is not None)
+
+
+def series_like_operator(left, right):
+    """Case-sensitive contains operator for pandas Series.
+
+    Args:
+        left: The pandas Series to search in
+        right: The value to search for
+
+    Returns:
+        pandas.Series: Boolean mask, True where right is contained in left
+    """
+    return left.astype(str).str.contains(str(right), regex=False)
+
+
+def series_ilike_operator(left, right):
+    """Case-insensitive contains operator for pandas Series.
+
+    Args:
+        left: The pandas Series to search in
+        right: The value to search for
+
+    Returns:
+        pandas.Series: Boolean mask, True where right is contained in left
+    """
+    return left.astype(str).str.lower().str.contains(str(right).lower(), regex=False)
+
+
+def series_in_operator(left, right):
+    """Membership operator for pandas Series.
+
+    Falls back to equality if right is not a list-like collection.
+
+    Args:
+        left: The pandas Series to check for membership
+        right: The collection to check membership in
+
+    Returns:
+        pandas.Series: Boolean mask, True where left is in right
+    """
+    if isinstance(right, (list, tuple, set, frozenset)):
+        return left.isin(right)
+    return left == right
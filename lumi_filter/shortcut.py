@@ -26,6 +26,7 @@ Alternative Syntax Mappings:
 """
 
 import logging
+import threading
 from typing import Iterable
 
 import peewee
@@ -36,13 +37,21 @@ from lumi_filter.model import Model
 
 logger = logging.getLogger("lumi_filter.shortcut")
 
+# Generated model classes keyed by the shape of the data, so repeated
+# requests against the same query or record layout skip ModelMeta.
+_model_cache = {}
+_MODEL_CACHE_MAXSIZE = 256
+# Guards eviction and insertion, which may run concurrently across requests.
+_model_cache_lock = threading.Lock()
+
 
 class AutoQueryModel:
     """Automatic query model generator.
 
     This class automatically generates filter models based on the structure
     of the provided data source, supporting both Peewee ORM queries and
-    iterable data structures.
+    iterable data structures. Generated model classes are cached per data
+    shape (selected columns, or keys and value types of the first item).
 
     Args:
         data: The data source to generate model from
@@ -52,19 +61,28 @@ class AutoQueryModel:
     def __new__(cls, data, request_args):
         cls.data = data
         cls.request_args = request_args
-        attrs = {}
         if isinstance(cls.data, peewee.ModelSelect):
+            columns = []
             for node in cls.data.selected_columns:
                 if isinstance(node, peewee.Field):
-                    attrs[node.name] = pw_filter_mapping.get(node.__class__, FilterField)(source=node)
+                    columns.append((node.name, node))
                 elif isinstance(node, peewee.Alias) and isinstance(node.node, peewee.Field):
-                    pw_field = node.node
-                    attrs[node.name] = pw_filter_mapping.get(pw_field.__class__, FilterField)(source=pw_field)
+                    columns.append((node.name, node.node))
                 else:
                     logger.warning(
                         "Unsupported field type in AutoQuery: %s. Using default FilterField.",
                         type(node),
                     )
+            # Peewee fields overload ==, so they are keyed by identity. The
+            # cached model keeps them alive as sources, so ids are not reused.
+            cache_key = ("peewee", tuple((name, id(pw_field)) for name, pw_field in columns))
+            model_class = _model_cache.get(cache_key)
+            if model_class is None:
+                attrs = {
+                    name: pw_filter_mapping.get(pw_field.__class__, FilterField)(source=pw_field)
+                    for name, pw_field in columns
+                }
+                model_class = cls._cache_model_class(cache_key, attrs)
         elif isinstance(cls.data, Iterable):
             cls.data = list(cls.data)
             if not cls.data:
@@ -72,6 +90,7 @@ class AutoQueryModel:
             # Check if first item is a dict
             if not isinstance(cls.data[0], dict):
                 raise TypeError("Unsupported data type for AutoQuery")
+            leaves = []
             stack = [(cls.data[0], "")]
             while stack:
                 current_dict, key_prefix = stack.pop()
@@ -80,13 +99,40 @@ class AutoQueryModel:
                     if isinstance(value, dict):
                         stack.append((value, new_key))
                     else:
-                        attrs[new_key.replace(".", "_")] = pd_filter_mapping.get(type(value), FilterField)(
-                            request_arg_name=new_key, source=new_key
-                        )
+                        leaves.append((new_key, type(value)))
+            cache_key = ("iterable", tuple(leaves))
+            model_class = _model_cache.get(cache_key)
+            if model_class is None:
+                attrs = {
+                    new_key.replace(".", "_"): pd_filter_mapping.get(value_type, FilterField)(
+                        request_arg_name=new_key, source=new_key
+                    )
+                    for new_key, value_type in leaves
+                }
+                model_class = cls._cache_model_class(cache_key, attrs)
         else:
             logger.error("Unsupported data type for AutoQuery: %s", type(cls.data))
             raise TypeError("Unsupported data type for AutoQuery")
-        return type("dynamic_filter_model", (Model,), attrs)(data=data, request_args=request_args)
+        return model_class(data=data, request_args=request_args)
+
+    @staticmethod
+    def _cache_model_class(cache_key, attrs):
+        """Create a model class from attrs and cache it under cache_key.
+
+        Args:
+            cache_key (tuple): Hashable description of the data shape
+            attrs (dict): Filter fields of the model
+
+        Returns:
+            type: The generated Model subclass
+        """
+        model_class = type("dynamic_filter_model", (Model,), attrs)
+        with _model_cache_lock:
+            if cache_key not in _model_cache and len(_model_cache) >= _MODEL_CACHE_MAXSIZE:
+                # Evict the oldest entry; dicts keep insertion order.
+                del _model_cache[next(iter(_model_cache))]
+            _model_cache[cache_key] = model_class
+        return model_class
 
 
 def compatible_request_args(request_args):
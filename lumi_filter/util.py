@@ -19,12 +19,16 @@ from collections.abc import MutableMapping
 from typing import get_args
 
 
+_MISSING = object()
+
+
 class ClassHierarchyMapping(MutableMapping):
     """Mapping that supports class hierarchy lookups via Method Resolution Order.
 
     This mapping class enables lookups that traverse the class hierarchy using
     Python's Method Resolution Order (MRO), allowing for inheritance-based
-    field type resolution.
+    field type resolution. Resolved lookups are cached per key and the cache
+    is cleared whenever the mapping is modified through its interface.
 
     Args:
         mapping (dict, optional): Initial mapping data
@@ -32,8 +36,26 @@ class ClassHierarchyMapping(MutableMapping):
 
     def __init__(self, mapping=None):
         self.data = dict(mapping) if mapping else {}
+        self._resolved = {}
 
     def __getitem__(self, key):
+        try:
+            value = self._resolved[key]
+        except KeyError:
+            value = self._resolved[key] = self._resolve(key)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def _resolve(self, key):
+        """Walk the MRO of key (or of each member of a union) for a mapped class.
+
+        Args:
+            key: The class or union type to resolve
+
+        Returns:
+            The mapped value, or _MISSING if no class in the hierarchy is mapped
+        """
         if isinstance(key, types.UnionType):
             keys = get_args(key)
         else:
@@ -42,14 +64,15 @@ class ClassHierarchyMapping(MutableMapping):
             for cls in inspect.getmro(key):
                 if cls in self.data:
                     return self.data[cls]
-
-        raise KeyError(key)
+        return _MISSING
 
     def __setitem__(self, key, value):
         self.data[key] = value
+        self._resolved.clear()
 
     def __delitem__(self, key):
         del self.data[key]
+        self._resolved.clear()
 
     def __iter__(self):
         return iter(self.data)
@@ -1,12 +1,21 @@
 """Tests for backend module."""
 
 import operator
+import sys
+from itertools import islice
 from unittest.mock import Mock, patch
 
 import peewee
 import pytest
 
-from lumi_filter.backend import IterableBackend, PeeweeBackend
+from lumi_filter.backend import (
+    IterableBackend,
+    PandasBackend,
+    PeeweeBackend,
+    _build_getter,
+    _compile_predicate_factory,
+    _split_key,
+)
 
 
 class TestPeeweeBackend:
@@ -21,11 +30,20 @@ class TestPeeweeBackend:
             "lte": operator.le,
             "gt": operator.gt,
             "lt": operator.lt,
-            "contains": operator.mod,
-            "icontains": operator.pow,
-            "in": operator.lshift,
         }
-        assert PeeweeBackend.LOOKUP_EXPR_OPERATOR_MAP == expected_map
+        for lookup_expr, operator_func in expected_map.items():
+            assert PeeweeBackend.LOOKUP_EXPR_OPERATOR_MAP[lookup_expr] is operator_func
+        assert set(PeeweeBackend.LOOKUP_EXPR_OPERATOR_MAP) == set(expected_map) | {"contains", "icontains", "in"}
+
+    def test_lookup_expr_operator_map_field_methods(self):
+        """Test that text and membership lookups call the peewee field methods."""
+        field = peewee.CharField()
+        field.name = "name"
+
+        ops = PeeweeBackend.LOOKUP_EXPR_OPERATOR_MAP
+        assert ops["contains"](field, "%a%").op == peewee.OP.LIKE
+        assert ops["icontains"](field, "%a%").op == peewee.OP.ILIKE
+        assert ops["in"](field, ["a", "b"]).op == peewee.OP.IN
 
     def test_filter_basic_equality(self):
         """Test basic equality filtering."""
@@ -44,21 +62,21 @@ class TestPeeweeBackend:
         """Test contains filtering with SQLite database."""
         mock_query = Mock()
         mock_field = Mock(spec=peewee.Field)
-        mock_field.__mod__ = Mock(return_value="field_like_expression")
+        mock_field.like = Mock(return_value="field_like_expression")
         mock_database = Mock(spec=peewee.SqliteDatabase)
         mock_query.model._meta.database = mock_database
 
         result = PeeweeBackend.filter(mock_query, mock_field, "test", "contains")
 
         # For SQLite, contains should transform value to *value*
-        mock_field.__mod__.assert_called_once_with("*test*")
+        mock_field.like.assert_called_once_with("*test*")
         mock_query.where.assert_called_once_with("field_like_expression")
 
     def test_filter_contains_proxy_sqlite(self):
         """Test contains filtering with Proxy wrapping SQLite database."""
         mock_query = Mock()
         mock_field = Mock(spec=peewee.Field)
-        mock_field.__mod__ = Mock(return_value="field_like_expression")
+        mock_field.like = Mock(return_value="field_like_expression")
         mock_proxy = Mock(spec=peewee.Proxy)
         mock_sqlite = Mock(spec=peewee.SqliteDatabase)
         mock_proxy.obj = mock_sqlite
@@ -66,33 +84,87 @@ class TestPeeweeBackend:
 
         result = PeeweeBackend.filter(mock_query, mock_field, "test", "contains")
 
-        mock_field.__mod__.assert_called_once_with("*test*")
+        mock_field.like.assert_called_once_with("*test*")
         mock_query.where.assert_called_once_with("field_like_expression")
 
     def test_filter_contains_other_database(self):
         """Test contains filtering with non-SQLite database."""
         mock_query = Mock()
         mock_field = Mock(spec=peewee.Field)
-        mock_field.__mod__ = Mock(return_value="field_like_expression")
+        mock_field.like = Mock(return_value="field_like_expression")
         mock_database = Mock(spec=peewee.PostgresqlDatabase)
         mock_query.model._meta.database = mock_database
 
         result = PeeweeBackend.filter(mock_query, mock_field, "test", "contains")
 
-        mock_field.__mod__.assert_called_once_with("%test%")
+        mock_field.like.assert_called_once_with("%test%")
         mock_query.where.assert_called_once_with("field_like_expression")
 
+    def test_is_sqlite_follows_rebinding(self):
+        """Test that the SQLite check follows a model re-bound to another database."""
+
+        class Item(peewee.Model):
+            class Meta:
+                database = peewee.SqliteDatabase(":memory:")
+
+        assert PeeweeBackend._is_sqlite(Item) is True
+
+        Item.bind(peewee.PostgresqlDatabase("test"))
+        assert PeeweeBackend._is_sqlite(Item) is False
+
+        with Item.bind_ctx(peewee.SqliteDatabase(":memory:")):
+            assert PeeweeBackend._is_sqlite(Item) is True
+        assert PeeweeBackend._is_sqlite(Item) is False
+
+    def test_is_sqlite_proxy(self):
+        """Test that a Proxy is checked against its current database."""
+        proxy = peewee.Proxy()
+
+        class Item(peewee.Model):
+            class Meta:
+                database = proxy
+
+        assert PeeweeBackend._is_sqlite(Item) is False
+
+        proxy.initialize(peewee.SqliteDatabase(":memory:"))
+        assert PeeweeBackend._is_sqlite(Item) is True
+
+        proxy.initialize(peewee.PostgresqlDatabase("test"))
+        assert PeeweeBackend._is_sqlite(Item) is False
+
     def test_filter_icontains(self):
         """Test case-insensitive contains filtering."""
         mock_query = Mock()
         mock_field = Mock(spec=peewee.Field)
-        mock_field.__pow__ = Mock(return_value="field_ilike_expression")
+        mock_field.ilike = Mock(return_value="field_ilike_expression")
 
         result = PeeweeBackend.filter(mock_query, mock_field, "test", "icontains")
 
-        mock_field.__pow__.assert_called_once_with("%test%")
+        mock_field.ilike.assert_called_once_with("%test%")
         mock_query.where.assert_called_once_with("field_ilike_expression")
 
+    def test_filter_icontains_sqlite_wildcards(self):
+        """Test that icontains passes LIKE wildcards through on a real database."""
+        test_database = peewee.SqliteDatabase(":memory:")
+
+        class Item(peewee.Model):
+            name = peewee.CharField()
+
+            class Meta:
+                database = test_database
+
+        with test_database:
+            Item.create_table()
+            for name in ("500 items", "AXB", "other"):
+                Item.create(name=name)
+
+            def names(value):
+                return sorted(item.name for item in PeeweeBackend.filter(Item.select(), Item.name, value, "icontains"))
+
+            assert names("50%") == ["500 items"]
+            assert names("a_b") == ["AXB"]
+            assert names("ITEMS") == ["500 items"]
+
     def test_filter_invalid_field_type(self):
         """Test filtering with invalid field type raises TypeError."""
         mock_query = Mock()
@@ -101,6 +173,30 @@ class TestPeeweeBackend:
         with pytest.raises(TypeError, match="Expected peewee.Field"):
             PeeweeBackend.filter(mock_query, invalid_field, "value", "")
 
+    def test_filter_many(self):
+        """Test applying several filters to the query."""
+        mock_query = Mock()
+        mock_field = Mock(spec=peewee.Field)
+        mock_query.where.return_value = mock_query
+
+        result = PeeweeBackend.filter_many(mock_query, [(mock_field, 1, ""), (mock_field, 5, "!")])
+
+        mock_query.where.assert_called_once_with(mock_field == 1, mock_field != 5)
+        assert result == mock_query
+
+    def test_filter_many_single_where_sql(self, peewee_query):
+        """Test that several conditions are ANDed in one WHERE clause."""
+        from tests.conftest import Product
+
+        query = PeeweeBackend.filter_many(
+            peewee_query, [(Product.price, 50, "gte"), (Product.name, "o", "contains"), (Product.is_active, True, "")]
+        )
+
+        sql, params = query.sql()
+        assert sql.count("WHERE") == 1
+        assert params == [50, "*o*", True]
+        assert sorted(product.name for product in query) == ["Laptop", "Smartphone"]
+
     def test_order_single_field(self):
         """Test ordering by a single field."""
         mock_query = Mock()
@@ -156,65 +252,97 @@ class TestIterableBackend:
         """Test getting simple nested values."""
         item = {"name": "test", "value": 123}
 
-        assert IterableBackend._get_nested_value(item, "name") == "test"
-        assert IterableBackend._get_nested_value(item, "value") == 123
+        assert IterableBackend._get_nested_value(item, ("name",)) == "test"
+        assert IterableBackend._get_nested_value(item, ("value",)) == 123
 
     def test_get_nested_value_deep(self):
         """Test getting deeply nested values."""
         item = {"user": {"profile": {"name": "John Doe", "age": 30}}}
 
-        assert IterableBackend._get_nested_value(item, "user.profile.name") == "John Doe"
-        assert IterableBackend._get_nested_value(item, "user.profile.age") == 30
+        assert IterableBackend._get_nested_value(item, ("user", "profile", "name")) == "John Doe"
+        assert IterableBackend._get_nested_value(item, ("user", "profile", "age")) == 30
 
     def test_get_nested_value_key_error(self):
         """Test that KeyError is raised for missing keys."""
         item = {"name": "test"}
 
         with pytest.raises(KeyError):
-            IterableBackend._get_nested_value(item, "missing_key")
+            IterableBackend._get_nested_value(item, ("missing_key",))
 
         # Test nested key error - this should raise KeyError during the second level access
         with pytest.raises((KeyError, TypeError)):
-            IterableBackend._get_nested_value(item, "name.missing_nested")
+            IterableBackend._get_nested_value(item, ("name", "missing_nested"))
+
+    def test_split_key(self):
+        """Test that key paths are split once and cached."""
+        assert _split_key("name") == ("name",)
+        assert _split_key("user.profile.age") == ("user", "profile", "age")
+        assert _split_key("user.profile.age") is _split_key("user.profile.age")
+        assert _split_key("a.profile")[1] is sys.intern("profile")
 
-    def test_match_item_equality(self):
+    def test_build_getter(self):
+        """Test getters built for flat and nested key paths."""
+        item = {"name": "test", "user": {"profile": {"age": 30}}}
+
+        assert isinstance(_build_getter("name"), operator.itemgetter)
+        assert _build_getter("name")(item) == "test"
+        assert _build_getter("user.profile.age")(item) == 30
+        assert _build_getter("user.profile.age") is _build_getter("user.profile.age")
+
+        with pytest.raises(KeyError):
+            _build_getter("user.missing")(item)
+
+    def test_build_predicate_equality(self):
         """Test item matching with equality."""
         item = {"name": "test", "value": 123}
 
-        assert IterableBackend._match_item(item, "name", "test", "") is True
-        assert IterableBackend._match_item(item, "name", "other", "") is False
-        assert IterableBackend._match_item(item, "value", 123, "") is True
+        assert IterableBackend._build_predicate("name", "test", "")(item) is True
+        assert IterableBackend._build_predicate("name", "other", "")(item) is False
+        assert IterableBackend._build_predicate("value", 123, "")(item) is True
 
-    def test_match_item_comparison(self):
+    def test_build_predicate_comparison(self):
         """Test item matching with comparison operators."""
         item = {"value": 100}
 
-        assert IterableBackend._match_item(item, "value", 50, "gt") is True
-        assert IterableBackend._match_item(item, "value", 150, "gt") is False
-        assert IterableBackend._match_item(item, "value", 100, "gte") is True
-        assert IterableBackend._match_item(item, "value", 50, "lt") is False
+        assert IterableBackend._build_predicate("value", 50, "gt")(item) is True
+        assert IterableBackend._build_predicate("value", 150, "gt")(item) is False
+        assert IterableBackend._build_predicate("value", 100, "gte")(item) is True
+        assert IterableBackend._build_predicate("value", 50, "lt")(item) is False
 
-    def test_match_item_contains(self):
+    def test_build_predicate_contains(self):
         """Test item matching with contains operators."""
         item = {"text": "Hello World"}
 
-        assert IterableBackend._match_item(item, "text", "World", "contains") is True
-        assert IterableBackend._match_item(item, "text", "world", "icontains") is True
-        assert IterableBackend._match_item(item, "text", "xyz", "contains") is False
+        assert IterableBackend._build_predicate("text", "World", "contains")(item) is True
+        assert IterableBackend._build_predicate("text", "world", "icontains")(item) is True
+        assert IterableBackend._build_predicate("text", "xyz", "contains")(item) is False
 
-    def test_match_item_in_operator(self):
+    def test_build_predicate_in_operator(self):
         """Test item matching with in operator."""
         item = {"category": "fruit"}
 
-        assert IterableBackend._match_item(item, "category", ["fruit", "vegetable"], "in") is True
-        assert IterableBackend._match_item(item, "category", ["meat", "dairy"], "in") is False
+        assert IterableBackend._build_predicate("category", ["fruit", "vegetable"], "in")(item) is True
+        assert IterableBackend._build_predicate("category", ["meat", "dairy"], "in")(item) is False
+
+    def test_build_predicate_in_operator_unhashable(self):
+        """Test in matching with unhashable item or filter values."""
+        assert IterableBackend._build_predicate("tags", ["a", "b"], "in")({"tags": ["a"]}) is False
+        assert IterableBackend._build_predicate("tags", [["a"], "b"], "in")({"tags": ["a"]}) is True
+
+    def test_build_predicate_nested_key(self):
+        """Test item matching on a nested key path."""
+        predicate = IterableBackend._build_predicate("user.age", 30, "gte")
+
+        assert predicate({"user": {"age": 35}}) is True
+        assert predicate({"user": {"age": 25}}) is False
+        assert predicate({"user": {}}) is True
 
-    def test_match_item_key_error_returns_true(self):
+    def test_build_predicate_key_error_returns_true(self):
         """Test that KeyError in matching returns True (permissive)."""
         item = {"name": "test"}
 
         # Missing key should return True (permissive filtering)
-        assert IterableBackend._match_item(item, "missing_key", "value", "") is True
+        assert IterableBackend._build_predicate("missing_key", "value", "")(item) is True
 
     def test_filter_list(self):
         """Test filtering list data."""
@@ -237,6 +365,28 @@ class TestIterableBackend:
         assert len(result) == 1
         assert result[0]["name"] == "Alice"
 
+    def test_filter_generator_stays_lazy(self):
+        """Test that filtering a generator returns a lazy iterator."""
+        data = ({"age": age} for age in (25, 30, 35))
+
+        result = IterableBackend.filter(data, "age", 25, "gt")
+        assert not isinstance(result, (list, tuple, set))
+        assert list(result) == [{"age": 30}, {"age": 35}]
+
+    def test_filter_iter_is_lazy(self):
+        """Test that filter_iter only checks items as they are consumed."""
+        data = [{"age": 25}, {"age": 30}, {"age": 35}, {"name": "no age"}]
+        checked = []
+
+        def tracked():
+            for item in data:
+                checked.append(item)
+                yield item
+
+        result = IterableBackend.filter_iter(tracked(), [("age", 25, "gt")])
+        assert list(islice(result, 1)) == [{"age": 30}]
+        assert len(checked) == 2
+
     def test_filter_set(self):
         """Test filtering set data."""
         # Note: sets with dictionaries are not practical, but testing the logic
@@ -249,6 +399,119 @@ class TestIterableBackend:
         assert isinstance(result, list)
         assert len(result) == 1
 
+    def test_filter_many(self):
+        """Test filtering by several conditions in one pass."""
+        data = [
+            {"name": "Alice", "age": 25, "city": "Paris"},
+            {"name": "Bob", "age": 30, "city": "Paris"},
+            {"name": "Charlie", "age": 35, "city": "London"},
+        ]
+
+        result = IterableBackend.filter_many(data, [("age", 25, "gt"), ("city", "Paris", "")])
+        assert isinstance(result, list)
+        assert [item["name"] for item in result] == ["Bob"]
+
+    def test_filter_many_no_conditions(self):
+        """Test that an empty condition list keeps every item."""
+        data = [{"name": "Alice"}, {"name": "Bob"}]
+
+        assert IterableBackend.filter_many(data, []) == data
+        assert list(IterableBackend.filter_iter(iter(data), [])) == data
+
+    def test_filter_many_lookup_without_priority(self):
+        """Test that a lookup missing from LOOKUP_EXPR_PRIORITY is checked last."""
+        data = [{"name": "Alice", "age": 25}, {"name": "Bob", "age": 30}, {"age": 40}]
+        operator_map = {**IterableBackend.LOOKUP_EXPR_OPERATOR_MAP, "startswith": str.startswith}
+
+        with patch.object(IterableBackend, "LOOKUP_EXPR_OPERATOR_MAP", operator_map):
+            result = IterableBackend.filter_many(data, [("name", "A", "startswith"), ("age", 20, "gt")])
+
+        # The item without a name goes through the permissive fallback.
+        assert result == [data[0], data[2]]
+
+    def test_filter_many_same_key_range(self):
+        """Test several conditions on the same key, including missing values."""
+        data = [
+            {"name": "Alice", "age": 25},
+            {"name": "Bob", "age": 30},
+            {"name": "Charlie", "age": 35},
+            {"name": "David"},
+            {"name": "Eve", "age": "unknown"},
+        ]
+
+        result = IterableBackend.filter_many(data, [("age", 26, "gte"), ("age", 34, "lte")])
+        assert [item["name"] for item in result] == ["Bob", "David", "Eve"]
+
+    def test_filter_many_checks_equality_before_contains(self):
+        """Test that cheaper lookups are evaluated before substring matches."""
+        item = {"name": "Alice", "age": 25}
+        calls = []
+        operator_map = {
+            **IterableBackend.LOOKUP_EXPR_OPERATOR_MAP,
+            "": lambda left, right: calls.append("") or left == right,
+            "contains": lambda left, right: calls.append("contains") or right in left,
+        }
+
+        with patch.object(IterableBackend, "LOOKUP_EXPR_OPERATOR_MAP", operator_map):
+            result = IterableBackend.filter_many([item], [("name", "li", "contains"), ("age", 30, "")])
+
+        assert result == []
+        assert calls == [""]
+
+    def test_filter_many_mixed_errors_are_permissive(self):
+        """Test that items raising in the generated predicate are re-checked per condition."""
+        data = [
+            {"name": "Alice", "age": 30, "profile": {"city": "Paris"}},
+            {"name": "Bob", "age": "unknown", "profile": {"city": "Paris"}},
+            {"name": "Charlie", "age": 30, "profile": None},
+            {"name": "David", "age": "unknown", "profile": {"city": "London"}},
+        ]
+
+        result = IterableBackend.filter_many(data, [("age", 26, "gte"), ("profile.city", "Paris", "")])
+        assert [item["name"] for item in result] == ["Alice", "Bob", "Charlie"]
+
+    def test_compile_predicate_factory(self):
+        """Test that generated predicates are cached per shape and bind values as arguments."""
+        shape = ((("user", "name"), "{0} == {1}"), (("age",), None))
+        factory = _compile_predicate_factory(shape)
+        assert _compile_predicate_factory(shape) is factory
+
+        predicate = factory(lambda item: "fallback", operator.eq, "Alice", operator.gt, 20)
+        assert predicate({"user": {"name": "Alice"}, "age": 25}) is True
+        assert predicate({"user": {"name": "Alice"}, "age": 15}) is False
+        assert predicate({"user": {"name": "Bob"}}) is False
+        assert predicate({"age": 25}) == "fallback"
+
+    def test_filter_sorted_matches_filter(self):
+        """Test that binary-search filtering returns the same slice as a linear filter."""
+        data = [{"user": {"age": age}} for age in (18, 20, 20, 25, 30, 30, 41)]
+
+        for lookup_expr in ("", "gt", "gte", "lt", "lte", "!"):
+            for value in (17, 20, 26, 30, 50):
+                expected = IterableBackend.filter(data, "user.age", value, lookup_expr)
+                assert IterableBackend.filter_sorted(data, "user.age", value, lookup_expr) == expected
+
+        assert isinstance(IterableBackend.filter_sorted(tuple(data), "user.age", 25, "gte"), tuple)
+
+    def test_filter_sorted_falls_back_on_incomparable_values(self):
+        """Test that a failed binary search falls back to the permissive linear filter."""
+        data = [{"age": 20}, {"age": "unknown"}, {"age": 30}]
+
+        result = IterableBackend.filter_sorted(data, "age", 25, "gte")
+
+        assert result == [{"age": "unknown"}, {"age": 30}]
+
+    def test_filter_sorted_drops_unprobed_items_without_key(self):
+        """Test that items lacking the key outside the bisected slice are dropped."""
+        data = [{"age": 1}, {"age": 2}, {"age": 3}, {"age": 4}, {}]
+
+        assert IterableBackend.filter_sorted(data, "age", 1, "lte") == [{"age": 1}]
+        assert IterableBackend.filter_many(data, [("age", 1, "lte")]) == [{"age": 1}, {}]
+
+    def test_lookup_expr_priority(self):
+        """Test that every lookup expression has an evaluation priority."""
+        assert set(IterableBackend.LOOKUP_EXPR_PRIORITY) == set(IterableBackend.LOOKUP_EXPR_OPERATOR_MAP)
+
     def test_order_single_field(self):
         """Test ordering by single field."""
         data = [
@@ -294,6 +557,22 @@ class TestIterableBackend:
         actual_names = [item["name"] for item in result]
         assert actual_names == expected_names
 
+    def test_order_mixed_directions(self):
+        """Test ordering by multiple fields with mixed directions."""
+        data = [
+            {"category": "B", "name": "Bob"},
+            {"category": "A", "name": "Alice"},
+            {"category": "A", "name": "Charlie"},
+            {"category": "B", "name": "David"},
+        ]
+
+        # First by category (ascending), then by name (descending)
+        ordering = [("category", False), ("name", True)]
+        result = IterableBackend.order(data, ordering)
+
+        actual_names = [item["name"] for item in result]
+        assert actual_names == ["Charlie", "Alice", "David", "Bob"]
+
     @patch("lumi_filter.backend.logger")
     def test_order_key_error_logs_warning(self, mock_logger):
         """Test that KeyError during ordering logs a warning."""
@@ -310,6 +589,24 @@ class TestIterableBackend:
         assert result == data
         mock_logger.warning.assert_called_once()
 
+    def test_filter_and_order(self):
+        """Test filtering and sorting into a single list."""
+        data = (item for item in [{"name": "Bob", "age": 30}, {"name": "Alice", "age": 25}, {"name": "Eve", "age": 20}])
+
+        result = IterableBackend.filter_and_order(data, [("age", 21, "gte")], [("name", False)])
+
+        assert result == [{"name": "Alice", "age": 25}, {"name": "Bob", "age": 30}]
+
+    @patch("lumi_filter.backend.logger")
+    def test_filter_and_order_key_error_logs_warning(self, mock_logger):
+        """Test that a failed sort still returns the filtered items."""
+        data = [{"name": "Bob", "age": 30}, {"name": "Alice", "age": 25}, {"name": "Eve", "age": 20}]
+
+        result = IterableBackend.filter_and_order(data, [("age", 21, "gte")], [("missing_field", False)])
+
+        assert result == data[:2]
+        mock_logger.warning.assert_called_once()
+
     def test_order_nested_field(self):
         """Test ordering by nested field."""
         data = [
@@ -323,3 +620,75 @@ class TestIterableBackend:
 
         scores = [item["user"]["profile"]["score"] for item in result]
         assert scores == [78, 85, 92]
+
+
+class TestPandasBackend:
+    """Test the PandasBackend class."""
+
+    @pytest.fixture
+    def df(self):
+        pandas = pytest.importorskip("pandas")
+        return pandas.DataFrame(
+            [
+                {"name": "Alice", "age": 25, "user.city": "Paris"},
+                {"name": "Bob", "age": 30, "user.city": "London"},
+                {"name": "Charlie", "age": 35, "user.city": "Paris"},
+            ]
+        )
+
+    def test_lookup_expr_operator_map(self):
+        """Test that lookup expression operator map has the same keys as the other backends."""
+        assert set(PandasBackend.LOOKUP_EXPR_OPERATOR_MAP) == set(IterableBackend.LOOKUP_EXPR_OPERATOR_MAP)
+
+    def test_filter_comparison(self, df):
+        """Test filtering with a comparison operator."""
+        result = PandasBackend.filter(df, "age", 30, "gte")
+        assert list(result["name"]) == ["Bob", "Charlie"]
+
+    def test_filter_contains(self, df):
+        """Test filtering with contains operators."""
+        assert list(PandasBackend.filter(df, "name", "li", "contains")["name"]) == ["Alice", "Charlie"]
+        assert list(PandasBackend.filter(df, "name", "BO", "icontains")["name"]) == ["Bob"]
+
+    def test_filter_in(self, df):
+        """Test filtering with the in operator."""
+        result = PandasBackend.filter(df, "name", ["Alice", "Bob"], "in")
+        assert list(result["name"]) == ["Alice", "Bob"]
+
+    def test_filter_many(self, df):
+        """Test filtering by several conditions, including a dotted column."""
+        result = PandasBackend.filter_many(df, [("age", 25, "gt"), ("user.city", "Paris", "")])
+        assert list(result["name"]) == ["Charlie"]
+
+    def test_from_records_flattens_nested_dicts(self):
+        """Test that nested records become dot-named columns usable as keys."""
+        pytest.importorskip("pandas")
+        records = [
+            {"name": "Alice", "user": {"age": 25}},
+            {"name": "Bob", "user": {"age": 30}},
+            {"name": "Charlie"},
+        ]
+
+        df = PandasBackend.from_records(iter(records))
+
+        assert list(df.columns) == ["name", "user.age"]
+        result = PandasBackend.filter_many(df, [("user.age", 26, "lt")])
+        assert list(result["name"]) == ["Alice"]
+
+    def test_filter_missing_column_is_permissive(self, df):
+        """Test that a condition on a missing column is skipped."""
+        result = PandasBackend.filter(df, "missing", "value", "")
+        assert len(result) == 3
+
+    def test_order_mixed_directions(self, df):
+        """Test ordering by multiple columns with mixed directions."""
+        result = PandasBackend.order(df, [("user.city", False), ("age", True)])
+        assert list(result["name"]) == ["Bob", "Charlie", "Alice"]
+
+    @patch("lumi_filter.backend.logger")
+    def test_order_missing_column_logs_warning(self, mock_logger, df):
+        """Test that ordering by a missing column logs a warning."""
+        result = PandasBackend.order(df, [("missing", False)])
+
+        assert result is df
+        mock_logger.warning.assert_called_once()
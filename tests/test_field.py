@@ -48,6 +48,11 @@ class TestFilterField:
         assert value is None
         assert is_valid is True
 
+    def test_fields_have_no_instance_dict(self):
+        """Test that built-in fields use slots instead of a per-instance __dict__."""
+        for field_class in (FilterField, IntField, StrField, DecimalField, BooleanField, DateField, DateTimeField):
+            assert not hasattr(field_class(), "__dict__")
+
 
 class TestIntField:
     """Test the IntField class."""
@@ -83,6 +88,24 @@ class TestIntField:
         assert value == 789
         assert is_valid is True
 
+        value, is_valid = field.parse_value(True)
+        assert value == 1
+        assert type(value) is int
+        assert is_valid is True
+
+    def test_parse_value_non_plain_digit_strings(self):
+        """Test strings that int() accepts but are not plain digits."""
+        field = IntField()
+        assert field.parse_value(" 42 ") == (42, True)
+        assert field.parse_value("+7") == (7, True)
+        assert field.parse_value("1_000") == (1000, True)
+        assert field.parse_value("²") == (None, False)
+
+    def test_parse_value_exceeds_int_digit_limit(self):
+        """Test that digit strings longer than int()'s limit are invalid, not raised."""
+        field = IntField()
+        assert field.parse_value("1" * 5000) == (None, False)
+
     def test_parse_value_invalid_string(self):
         """Test parsing invalid string values."""
         field = IntField()
@@ -318,11 +341,25 @@ class TestDateField:
         assert value == datetime_obj
         assert is_valid is True
 
+    def test_parse_value_cached(self):
+        """Test that repeated date strings reuse the cached parse."""
+        field = DateField()
+        first, _ = field.parse_value("2024-02-29")
+        second, _ = DateField().parse_value("2024-02-29")
+        assert first is second
+
+    def test_parse_value_non_padded_string(self):
+        """Test parsing date strings without zero padding."""
+        field = DateField()
+        value, is_valid = field.parse_value("2024-1-5")
+        assert value == datetime.date(2024, 1, 5)
+        assert is_valid is True
+
     def test_parse_value_invalid(self):
         """Test parsing invalid date values."""
         field = DateField()
 
-        invalid_values = ["not-a-date", "2024-13-01", "", None, 123]
+        invalid_values = ["not-a-date", "2024-13-01", "2024-W03-1", "20240115", "", None, 123]
         for val in invalid_values:
             value, is_valid = field.parse_value(val)
             assert value is None
@@ -355,6 +392,13 @@ class TestDateTimeField:
         assert value == datetime_obj
         assert is_valid is True
 
+    def test_parse_value_non_padded_string(self):
+        """Test parsing datetime strings without zero padding."""
+        field = DateTimeField()
+        value, is_valid = field.parse_value("2024-1-5T9:05:00")
+        assert value == datetime.datetime(2024, 1, 5, 9, 5, 0)
+        assert is_valid is True
+
     def test_parse_value_date_object(self):
         """Test parsing date objects."""
         field = DateTimeField()
@@ -369,7 +413,16 @@ class TestDateTimeField:
         """Test parsing invalid datetime values."""
         field = DateTimeField()
 
-        invalid_values = ["not-a-datetime", "2024-13-01T25:00:00", "", None, 123]
+        invalid_values = [
+            "not-a-datetime",
+            "2024-13-01T25:00:00",
+            "2024-01-15",
+            "2024-01-15T10:30+01",
+            "2024-01-15T10:30:00+01:00",
+            "",
+            None,
+            123,
+        ]
         for val in invalid_values:
             value, is_valid = field.parse_value(val)
             assert value is None
@@ -1,12 +1,14 @@
 """Tests for model module."""
 
-from unittest.mock import Mock
+import sys
+from unittest.mock import Mock, patch
 
 import peewee
 import pydantic
 import pytest
 
 from lumi_filter.field import FilterField, IntField, StrField
+from lumi_filter.map import pd_filter_mapping
 from lumi_filter.model import MetaModel, Model, ModelMeta
 
 
@@ -170,6 +172,58 @@ class TestMetaModel:
         assert "name" in fields
         assert isinstance(fields["name"], FilterField)
 
+    def test_get_filter_fields_cached_introspection(self):
+        """Test that the schema walk is cached but fresh field instances are returned."""
+
+        class TestModel(pydantic.BaseModel):
+            name: str
+            value: int
+
+        with patch.object(
+            MetaModel, "_iter_pydantic_fields", autospec=True, side_effect=MetaModel._iter_pydantic_fields
+        ) as walk:
+            first = MetaModel(schema=TestModel, fields=["name"]).get_filter_fields()
+            second = MetaModel(schema=TestModel, fields=["name"]).get_filter_fields()
+
+        assert walk.call_count == 1
+        assert list(first) == list(second) == ["name"]
+        assert first["name"] is not second["name"]
+        assert type(first["name"]) is type(second["name"]) is StrField
+        assert second["name"].source == "name"
+
+    def test_get_filter_fields_honours_mapping_changes(self):
+        """Test that mapping changes apply to schemas that were already walked."""
+
+        class TestModel(pydantic.BaseModel):
+            count: int
+
+        class CustomIntField(IntField):
+            pass
+
+        assert type(MetaModel(schema=TestModel).get_filter_fields()["count"]) is IntField
+
+        pd_filter_mapping[int] = CustomIntField
+        try:
+            assert type(MetaModel(schema=TestModel).get_filter_fields()["count"]) is CustomIntField
+        finally:
+            pd_filter_mapping[int] = IntField
+
+    def test_get_filter_fields_meta_model_subclass(self):
+        """Test that cached walks respect MetaModel subclass overrides."""
+
+        class Address(pydantic.BaseModel):
+            city: str
+
+        class TestModel(pydantic.BaseModel):
+            address: Address
+
+        class FlatMetaModel(MetaModel):
+            def _is_nested_pydantic_model(self, pydantic_field):
+                return False
+
+        assert list(MetaModel(schema=TestModel).get_filter_fields()) == ["address_city"]
+        assert list(FlatMetaModel(schema=TestModel).get_filter_fields()) == ["address"]
+
 
 class TestModelMeta:
     """Test the ModelMeta metaclass."""
@@ -192,6 +246,20 @@ class TestModelMeta:
         assert "age" in supported_keys
         assert "age__gt" in supported_keys
 
+    def test_custom_lookup_expressions(self):
+        """Test query keys generated for a field with custom lookup expressions."""
+
+        class RangeField(IntField):
+            SUPPORTED_LOOKUP_EXPR = {"", "!", "gte", "lte"}
+
+        class TestModel(Model):
+            age = RangeField(request_arg_name="years")
+
+        supported_keys = TestModel.__supported_query_key_field_dict__
+        assert set(supported_keys) == {"years", "years!", "years__gte", "years__lte"}
+        assert supported_keys["years__gte"].lookup_expr == "gte"
+        assert supported_keys["years!"].lookup_expr == "!"
+
     def test_create_model_with_meta(self, setup_test_db):
         """Test creating model with Meta schema."""
         from tests.conftest import Product
@@ -258,6 +326,35 @@ class TestModelMeta:
         assert "age__lt" in supported_keys
         assert "age__contains" not in supported_keys
 
+        # Entries are (field, lookup_expr) named tuples
+        field_info = supported_keys["name__icontains"]
+        assert field_info == (TestModel.name, "icontains")
+        assert field_info.field is TestModel.name
+        assert field_info.lookup_expr == "icontains"
+
+    def test_supported_query_keys_interned(self):
+        """Test that generated query keys are interned strings."""
+
+        class TestModel(Model):
+            age = IntField()
+
+        for key in TestModel.__supported_query_key_field_dict__:
+            assert key is sys.intern("".join(key))
+
+    def test_filter_dispatch_generation(self):
+        """Test that the filter dispatch table mirrors the supported query keys."""
+
+        class TestModel(Model):
+            name = StrField(source="user.name")
+
+        dispatch = TestModel.__filter_dispatch__
+        assert set(dispatch) == set(TestModel.__supported_query_key_field_dict__)
+
+        source, parse_value, lookup_expr = dispatch["name__icontains"]
+        assert source == "user.name"
+        assert parse_value == TestModel.name.parse_value
+        assert lookup_expr == "icontains"
+
     def test_source_type_consistency_error(self):
         """Test that mixed source types raise ValueError."""
         with pytest.raises(ValueError, match="different source types"):
@@ -294,6 +391,19 @@ class TestModel:
         assert model.data == sample_products_data
         assert model.request_args == request_args
 
+    def test_backend_resolved_from_current_data(self, sample_products_data):
+        """Test that the backend follows data reassigned after initialization."""
+
+        class ProductFilter(Model):
+            id = IntField()
+
+        model = ProductFilter(42, {"id__gt": "2"})
+        with pytest.raises(TypeError, match="Unsupported data type"):
+            model.filter()
+
+        model.data = sample_products_data
+        assert [item["id"] for item in model.filter().result()] == [3, 4, 5]
+
     def test_filter_and_result_chaining(self, sample_products_data):
         """Test filter and result method chaining."""
 
@@ -326,6 +436,51 @@ class TestModel:
         names = [item["name"] for item in result]
         assert names == sorted(names)
 
+    def test_filter_and_order_chaining(self, sample_products_data):
+        """Test that filter_and_order matches chaining filter and order."""
+
+        class ProductFilter(Model):
+            id = IntField()
+            category_name = StrField()
+
+        request_args = {"category_name__icontains": "o", "id__gte": "2", "ordering": "category_name,-id"}
+
+        fused = ProductFilter(iter(sample_products_data), request_args).filter_and_order().result()
+        chained = ProductFilter(sample_products_data, request_args).filter().order().result()
+
+        assert isinstance(fused, list)
+        assert fused == chained
+        assert [item["id"] for item in fused] == [3, 5, 4, 2]
+
+    def test_cls_filter_and_order_failed_sort_keeps_tuple(self):
+        """Test that a failed sort returns the same container type as chaining."""
+
+        class ItemFilter(Model):
+            id = IntField()
+            rank = IntField()
+
+        data = ({"id": 1, "rank": 2}, {"id": 2, "rank": None}, {"id": 3, "rank": 1})
+        request_args = {"id__gte": "2", "ordering": "rank"}
+
+        fused = ItemFilter.cls_filter_and_order(data, request_args)
+        chained = ItemFilter.cls_order(ItemFilter.cls_filter(data, request_args), request_args)
+
+        assert type(fused) is type(chained) is tuple
+        assert fused == chained == data[1:]
+
+    def test_cls_filter_and_order_without_ordering(self, sample_products_data):
+        """Test cls_filter_and_order with only filters or only ordering."""
+
+        class ProductFilter(Model):
+            id = IntField()
+
+        filtered = ProductFilter.cls_filter_and_order(sample_products_data, {"id__gte": "4"})
+        ordered = ProductFilter.cls_filter_and_order(sample_products_data, {"ordering": "-id"})
+
+        assert [item["id"] for item in filtered] == [4, 5]
+        assert [item["id"] for item in ordered] == [5, 4, 3, 2, 1]
+        assert ProductFilter.cls_filter_and_order(sample_products_data, {}) is sample_products_data
+
     # def test_cls_filter_with_iterable_data(self, sample_products_data):
     #     """Test cls_filter method with iterable data."""
 
@@ -357,6 +512,20 @@ class TestModel:
         assert len(result) == 1
         assert result[0]["name"] == "Laptop"
 
+    def test_cls_filter_with_many_unrelated_args(self, sample_products_data):
+        """Test cls_filter when request args outnumber the supported keys."""
+
+        class ProductFilter(Model):
+            name = StrField()
+
+        request_args = {f"param{i}": "value" for i in range(50)}
+        request_args["name"] = "Laptop"
+        assert len(request_args) > len(ProductFilter.__filter_dispatch__)
+
+        result = ProductFilter.cls_filter(sample_products_data, request_args)
+
+        assert [item["name"] for item in result] == ["Laptop"]
+
     def test_cls_filter_with_invalid_value(self, sample_products_data):
         """Test cls_filter ignores invalid values."""
 
@@ -379,9 +548,8 @@ class TestModel:
         result = ProductFilter.cls_filter(sample_products_data, request_args)
 
         # Should find items with names in the list
-        names = [item["name"] for item in result]
-        assert "Laptop" in names
-        assert "Smartphone" in names
+        names = {item["name"] for item in result}
+        assert {"Laptop", "Smartphone"} <= names
 
     def test_cls_order_ascending(self, sample_products_data):
         """Test cls_order with ascending order."""
@@ -456,6 +624,16 @@ class TestModel:
         names = [item["name"] for item in result]
         assert names == sorted(names)
 
+    def test_get_ordering_single_field(self):
+        """Test _get_ordering with a single ordering token."""
+
+        class ProductFilter(Model):
+            name = StrField()
+
+        assert ProductFilter._get_ordering({"ordering": "name"}) == [("name", False)]
+        assert ProductFilter._get_ordering({"ordering": "-name"}) == [("name", True)]
+        assert ProductFilter._get_ordering({"ordering": "invalid_field"}) == []
+
     def test_get_backend_peewee(self, peewee_query):
         """Test _get_backend with Peewee query."""
         from lumi_filter.backend import PeeweeBackend
@@ -470,16 +648,47 @@ class TestModel:
         backend = Model._get_backend(sample_products_data)
         assert backend == IterableBackend
 
-    # def test_get_backend_unsupported_type(self):
-    #     """Test _get_backend with unsupported data type."""
-    #     # Model._get_backend should handle the type checking properly
-    #     # Let's check what happens with an invalid type
-    #     try:
-    #         Model._get_backend("invalid_data_type")
-    #         # If no exception is raised, the test should check the actual behavior
-    #         assert False, "Expected TypeError to be raised"
-    #     except TypeError as e:
-    #         assert "Unsupported data type" in str(e)
+    def test_get_backend_dataframe(self, sample_products_data):
+        """Test _get_backend with a pandas DataFrame."""
+        pandas = pytest.importorskip("pandas")
+        from lumi_filter.backend import PandasBackend
+
+        backend = Model._get_backend(pandas.DataFrame(sample_products_data))
+        assert backend == PandasBackend
+
+    def test_get_backend_cached_per_type(self, sample_products_data):
+        """Test that the backend is resolved once per data type."""
+        from lumi_filter.backend import IterableBackend
+
+        class Records(list):
+            pass
+
+        with patch.object(Model, "_resolve_backend", wraps=Model._resolve_backend) as resolve_backend:
+            assert Model._get_backend(Records(sample_products_data)) is IterableBackend
+            assert Model._get_backend(Records()) is IterableBackend
+
+        assert resolve_backend.call_count == 1
+
+    def test_get_backend_cached_per_model_class(self, sample_products_data):
+        """Test that a subclass overriding _resolve_backend gets its own cache entries."""
+        from lumi_filter.backend import IterableBackend, PandasBackend
+
+        class Records(list):
+            pass
+
+        class CustomFilter(Model):
+            @classmethod
+            def _resolve_backend(cls, data):
+                return PandasBackend
+
+        assert Model._get_backend(Records(sample_products_data)) is IterableBackend
+        assert CustomFilter._get_backend(Records(sample_products_data)) is PandasBackend
+        assert Model._get_backend(Records()) is IterableBackend
+
+    def test_get_backend_unsupported_type(self):
+        """Test _get_backend with unsupported data type."""
+        with pytest.raises(TypeError, match="Unsupported data type"):
+            Model._get_backend(42)
 
     def test_peewee_integration(self, setup_test_db):
         """Test integration with Peewee models."""
@@ -495,3 +704,6 @@ class TestModel:
         # This should work without errors
         filtered_query = ProductFilter.cls_filter(query, request_args)
         assert filtered_query is not None
+
+        fused_query = ProductFilter.cls_filter_and_order(query, {"price__gte": "50", "ordering": "-price"})
+        assert [product.name for product in fused_query] == ["Laptop", "Smartphone", "Jeans"]
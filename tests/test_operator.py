@@ -10,6 +10,7 @@ from lumi_filter.operator import (
     generic_is_null_operator,
     generic_like_operator,
     is_null_operator,
+    lowered_ilike_operator,
     operator_curry,
 )
 
@@ -65,6 +66,21 @@ class TestGenericIlikeOperator:
         assert generic_ilike_operator(12345, "67") is False
 
 
+class TestLoweredIlikeOperator:
+    """Test the lowered_ilike_operator function."""
+
+    def test_case_insensitive_contains(self):
+        """Test contains with a pre-lowered needle."""
+        assert lowered_ilike_operator("Hello World", "world") is True
+        assert lowered_ilike_operator("HELLO WORLD", "hello") is True
+        assert lowered_ilike_operator("Hello World", "xyz") is False
+
+    def test_non_string_haystack(self):
+        """Test with non-string values to search in."""
+        assert lowered_ilike_operator(12345, "234") is True
+        assert lowered_ilike_operator(None, "none") is True
+
+
 class TestGenericInOperator:
     """Test the generic_in_operator function."""
 
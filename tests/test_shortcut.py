@@ -1,11 +1,13 @@
 """Tests for shortcut module."""
 
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import Mock, patch
 
 import peewee
 import pytest
 
 from lumi_filter.field import IntField, StrField
+from lumi_filter import shortcut
 from lumi_filter.shortcut import AutoQueryModel, compatible_request_args
 
 
@@ -52,6 +54,18 @@ class TestAutoQueryModel:
         # Should have field with alias name
         assert "product_name" in auto_model.__supported_query_key_field_dict__
 
+    def test_auto_query_model_class_cached_for_peewee(self, setup_test_db):
+        """Test that queries selecting the same columns reuse the generated model class."""
+        from tests.conftest import Product
+
+        first = AutoQueryModel(Product.select(Product.name, Product.price), {})
+        second = AutoQueryModel(Product.select(Product.name, Product.price), {"name": "Laptop"})
+        other = AutoQueryModel(Product.select(Product.name), {})
+
+        assert type(first) is type(second)
+        assert type(other) is not type(first)
+        assert second.request_args == {"name": "Laptop"}
+
     @patch("lumi_filter.shortcut.logger")
     def test_auto_query_unsupported_peewee_field(self, mock_logger, setup_test_db):
         """Test AutoQueryModel with unsupported Peewee field type."""
@@ -94,6 +108,29 @@ class TestAutoQueryModel:
         assert "user.profile.age" in supported_keys
         assert "user.profile.city" in supported_keys
 
+    def test_auto_query_model_class_cached_for_iterable(self):
+        """Test that data with the same keys and value types reuse the generated model class."""
+        first = AutoQueryModel([{"name": "a", "meta": {"age": 1}}], {})
+        second = AutoQueryModel([{"name": "b", "meta": {"age": 2}}], {})
+        other = AutoQueryModel([{"name": "c", "meta": {"age": "3"}}], {})
+
+        assert type(first) is type(second)
+        assert type(other) is not type(first)
+        assert isinstance(type(other).__ordering_field_map__["meta_age"], StrField)
+
+    def test_auto_query_model_cache_eviction_concurrent(self):
+        """Test that concurrent model generation keeps the cache bounded without errors."""
+
+        def build(i):
+            return AutoQueryModel([{f"field_{i}": i}], {})
+
+        with patch.dict(shortcut._model_cache, clear=True), patch.object(shortcut, "_MODEL_CACHE_MAXSIZE", 4):
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                models = list(executor.map(build, range(200)))
+
+            assert len(models) == 200
+            assert len(shortcut._model_cache) <= 4
+
     def test_auto_query_empty_data_error(self):
         """Test AutoQueryModel with empty iterable raises error."""
         empty_data = []
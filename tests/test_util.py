@@ -244,6 +244,29 @@ class TestClassHierarchyMapping:
         with pytest.raises(KeyError):
             _ = mapping[str]
 
+    def test_resolved_lookups_cached_and_invalidated(self):
+        """Test that resolved lookups are cached and reset when the mapping changes."""
+
+        class BaseClass:
+            pass
+
+        class DerivedClass(BaseClass):
+            pass
+
+        mapping = ClassHierarchyMapping({BaseClass: "base_handler"})
+        assert mapping.get(DerivedClass) == "base_handler"
+        assert mapping.get(int) is None
+        assert mapping._resolved[DerivedClass] == "base_handler"
+
+        mapping[DerivedClass] = "derived_handler"
+        assert mapping[DerivedClass] == "derived_handler"
+
+        mapping[int] = "int_handler"
+        assert mapping[int] == "int_handler"
+
+        del mapping[DerivedClass]
+        assert mapping[DerivedClass] == "base_handler"
+
     def test_empty_mapping_operations(self):
         """Test operations on empty mapping."""
         mapping = ClassHierarchyMapping()